@@ -0,0 +1,80 @@
+"""
+Micro-benchmark for the BaseWidget attribute hooks.
+
+Compares attribute access on an lst ``Label`` using the per-class property table
+with the previous implementation, which called ``find_property`` on every access,
+and with a plain Python object as the lower bound.
+
+Needs a display; run it headless with e.g.::
+
+    xvfb-run python benchmarks/attribute_access.py
+"""
+import argparse
+import timeit
+import lst  # noqa: F401
+from gi.repository import Gtk
+from lst.widgets.label import Label
+
+
+class FindPropertyLabel(Label):
+    """``Label`` with the attribute hooks as they were before the property table."""
+
+    __gtype_name__ = "BenchFindPropertyLabel"
+
+    def __getattribute__(self, name):
+        if name.startswith("set_") and name != "set_property":
+            property_name = name.replace("set_", "")
+            if self.find_property(property_name):
+                return lambda value: self.set_property(property_name, value)
+        return Gtk.Label.__getattribute__(self, name)
+
+    def __setattr__(self, name, value):
+        if self.find_property(name):
+            self.set_property(name, value)
+        else:
+            Gtk.Label.__setattr__(self, name, value)
+
+    def __getattr__(self, name):
+        if self.find_property(name):
+            return self.get_property(name)
+        else:
+            Gtk.Label.__getattribute__(self, name)
+
+
+class PlainObject:
+    def __init__(self):
+        self._class_name = None
+        self.label = ""
+
+    def set_label(self, value):
+        self.label = value
+
+
+CASES = {
+    "private attribute read": "widget._class_name",
+    "property read": "widget.label",
+    "property write": "widget.label = 'text'",
+    "set_<prop> call": "widget.set_label('text')",
+}
+
+
+def run(number: int) -> None:
+    widgets = {
+        "find_property (before)": FindPropertyLabel(label="text"),
+        "property table (after)": Label(label="text"),
+        "plain python object": PlainObject(),
+    }
+
+    print(f"{'case':<24}{'implementation':<26}{'ns/op':>10}")
+    for case, stmt in CASES.items():
+        for name, widget in widgets.items():
+            seconds = min(
+                timeit.repeat(stmt, globals={"widget": widget}, number=number, repeat=5)
+            )
+            print(f"{case:<24}{name:<26}{seconds / number * 1e9:>10.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", "--number", type=int, default=100_000)
+    run(parser.parse_args().number)
@@ -0,0 +1,117 @@
+"""
+Replay benchmark for the Hyprland event stream reader.
+
+Feeds a recorded or synthetic ``.socket2.sock`` stream to ``EventReader`` in chunks of
+the given sizes and reports events per second and how many events arrived intact,
+next to the previous reader that split every ``recv(1024)`` on newlines on its own.
+
+Record a real stream with e.g.::
+
+    socat -u UNIX-CONNECT:/tmp/hypr/$HYPRLAND_INSTANCE_SIGNATURE/.socket2.sock - > events.log
+
+and replay it with::
+
+    python benchmarks/hyprland_events.py --file events.log
+"""
+import argparse
+import random
+import statistics
+import time
+from collections import Counter
+import lst  # noqa: F401
+from lst.services.hyprland import EventReader
+
+HANDLED = ("workspace", "destroyworkspace", "focusedmon", "activelayout", "activewindow")
+
+
+def synthetic_stream(n: int, seed: int = 0) -> bytes:
+    rng = random.Random(seed)
+    lines = []
+    for i in range(n):
+        kind = rng.random()
+        if kind < 0.4:
+            lines.append(f"workspace>>{rng.randint(1, 10)}")
+        elif kind < 0.5:
+            lines.append(f"focusedmon>>DP-{rng.randint(1, 3)},{rng.randint(1, 10)}")
+        elif kind < 0.8:
+            title = " — ".join(f"Вкладка {j}, tab {i}" for j in range(rng.randint(1, 30)))
+            lines.append(f"activewindow>>firefox,{title}")
+        elif kind < 0.9:
+            lines.append("activelayout>>at-translated-set-2-keyboard,English (US, intl., with dead keys)")
+        else:
+            lines.append(f"openwindow>>{i:x},{rng.randint(1, 10)},kitty,kitty")
+    return ("\n".join(lines) + "\n").encode()
+
+
+def expected_events(stream: bytes) -> list:
+    events = []
+    for line in stream.decode("utf-8", "replace").split("\n"):
+        name, _, payload = line.partition(">>")
+        if name in HANDLED:
+            events.append((name, payload))
+    return events
+
+
+def replay_reader(stream: bytes, chunk_size: int) -> list:
+    events = []
+    reader = EventReader(
+        {name: (lambda name: lambda data: events.append((name, data)))(name) for name in HANDLED}
+    )
+    for i in range(0, len(stream), chunk_size):
+        reader.feed(stream[i:i + chunk_size])
+    return events
+
+
+def replay_legacy(stream: bytes, chunk_size: int) -> list:
+    events = []
+    for i in range(0, len(stream), chunk_size):
+        for line in stream[i:i + chunk_size].decode("utf-8", "replace").split("\n"):
+            name, _, payload = line.partition(">>")
+            if name in HANDLED:
+                events.append((name, payload))
+    return events
+
+
+READERS = {
+    "EventReader": replay_reader,
+    "legacy recv/split": replay_legacy,
+}
+
+
+def run(stream: bytes, chunk_sizes: list, repeat: int) -> None:
+    expected = expected_events(stream)
+    print(f"{len(stream)} bytes, {len(expected)} handled events")
+    print(f"{'reader':<20}{'chunk':>8}{'events/s':>14}{'intact':>10}{'broken':>10}")
+    for chunk_size in chunk_sizes:
+        for name, replay in READERS.items():
+            samples = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                events = replay(stream, chunk_size)
+                samples.append(time.perf_counter() - start)
+
+            intact = sum((Counter(events) & Counter(expected)).values())
+            print(
+                f"{name:<20}{chunk_size:>8}{len(expected) / statistics.median(samples):>14.0f}"
+                f"{intact:>10}{len(events) - intact:>10}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--file", help="Recorded event stream (default: synthetic)")
+    parser.add_argument("-n", "--events", type=int, default=100_000)
+    parser.add_argument("--chunk-sizes", type=int, nargs="+", default=[1024, 4096, 65536])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, "rb") as file:
+            stream = file.read()
+    else:
+        stream = synthetic_stream(args.events)
+    run(stream, args.chunk_sizes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""
+Widget construction and binding throughput benchmarks.
+
+Runs headless under a virtual display or GTK's broadway backend::
+
+    xvfb-run python benchmarks/suite.py
+    GDK_BACKEND=broadway python benchmarks/suite.py
+
+Results are written as JSON (``--output``, default ``bench-<commit>.json``) so runs can be
+compared across commits with ``python benchmarks/suite.py --compare old.json new.json``.
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import lst  # noqa: F401
+from gi.repository import GLib, GObject, Gtk
+from lst.base_service import BaseService
+from lst.widgets.box import Box
+from lst.widgets.button import Button
+from lst.widgets.image import Image
+from lst.widgets.label import Label
+
+
+class BenchService(BaseService):
+    def __init__(self):
+        super().__init__()
+        self._value = 0
+
+    @GObject.Property
+    def value(self) -> int:
+        return self._value
+
+    def bump(self) -> None:
+        self._value += 1
+        self.notify("value")
+
+
+def drain() -> None:
+    context = GLib.MainContext.default()
+    while context.pending():
+        context.iteration(False)
+
+
+def row(i: int) -> Gtk.Widget:
+    return Box(
+        spacing=4,
+        child=[
+            Image(image="image-missing", pixel_size=16),
+            Label(label=f"row {i}"),
+            Button(child=Label(label="open")),
+        ],
+    )
+
+
+def bench_build_tree(n: int, repeat: int) -> list:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        box = Box(orientation="v", child=[row(i) for i in range(n)])
+        samples.append(time.perf_counter() - start)
+        box.destroy()
+        drain()
+    return samples
+
+
+def bench_replace_child(n: int, repeat: int) -> list:
+    box = Box(orientation="v")
+    lists = [[Label(label=f"{j}:{i}") for i in range(n)] for j in range(2)]
+    samples = []
+    for k in range(repeat):
+        start = time.perf_counter()
+        box.child = lists[k % 2]
+        samples.append(time.perf_counter() - start)
+    box.destroy()
+    return samples
+
+
+def bench_binding_fanout(n: int, repeat: int) -> list:
+    service = BenchService()
+    labels = [
+        Label(label=service.bind("value", lambda v: f"value {v}"))
+        for _ in range(n)
+    ]
+    drain()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        service.bump()
+        drain()
+        samples.append(time.perf_counter() - start)
+    for label in labels:
+        label.destroy()
+    return samples
+
+
+def bench_notify_to_repaint(n: int, repeat: int) -> list:
+    service = BenchService()
+    label = Label(label=service.bind("value", str))
+    window = Gtk.OffscreenWindow()
+    window.add(Box(orientation="v", child=[label] + [row(i) for i in range(n)]))
+    window.show_all()
+    drain()
+
+    drawn = []
+    label.connect("draw", lambda *args: drawn.append(time.perf_counter()))
+
+    context = GLib.MainContext.default()
+    samples = []
+    for _ in range(repeat):
+        drawn.clear()
+        start = time.perf_counter()
+        service.bump()
+        while not drawn and time.perf_counter() - start < 1:
+            context.iteration(True)
+        if drawn:
+            samples.append(drawn[0] - start)
+    window.destroy()
+    return samples
+
+
+BENCHMARKS = {
+    "build_tree": bench_build_tree,
+    "replace_child": bench_replace_child,
+    "binding_fanout": bench_binding_fanout,
+    "notify_to_repaint": bench_notify_to_repaint,
+}
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def summarize(samples: list) -> dict:
+    if not samples:
+        return {"samples": 0}
+    return {
+        "samples": len(samples),
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "max": max(samples),
+    }
+
+
+def run(sizes: list, repeat: int, names: list) -> dict:
+    results = {}
+    for name in names:
+        for n in sizes:
+            key = f"{name}[n={n}]"
+            results[key] = summarize(BENCHMARKS[name](n, repeat))
+            print(f"{key:<32}{results[key].get('median', float('nan')) * 1000:>10.3f} ms")
+    return {
+        "commit": git_commit(),
+        "timestamp": int(time.time()),
+        "python": platform.python_version(),
+        "gtk": f"{Gtk.get_major_version()}.{Gtk.get_minor_version()}.{Gtk.get_micro_version()}",
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(old_path: str, new_path: str) -> None:
+    with open(old_path) as file:
+        old = json.load(file)
+    with open(new_path) as file:
+        new = json.load(file)
+
+    print(f"{'benchmark':<32}{old['commit']:>12}{new['commit']:>12}{'ratio':>8}")
+    for key, result in new["results"].items():
+        before = old["results"].get(key, {}).get("median")
+        after = result.get("median")
+        if before and after:
+            print(f"{key:<32}{before * 1000:>10.3f}ms{after * 1000:>10.3f}ms{after / before:>8.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="lst widget and binding benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS))
+    parser.add_argument("--output", help="Result file (default: bench-<commit>.json)")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"))
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    report = run(args.sizes, args.repeat, args.only)
+    output = args.output or f"bench-{report['commit']}.json"
+    with open(output, "w") as file:
+        json.dump(report, file, indent=2)
+    print(f"Results written to {output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,55 @@
+import fnmatch
+import importlib
 import os
-import sass
 import sys
+import threading
 import traceback
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
+from lst.binding import PropertyBinding
+from lst.client import APP_INTERFACE_NAME, APP_OBJECT_PATH
+from lst.config_scope import config_scope
 from lst.dbus import DbusService
-from lst.utils import load_interface_xml
+from lst.profiler import profiler
+from lst.style import style_sheet
+from lst.utils import load_interface_xml, compile_scss
 from gi.repository import Gtk, Gdk, Gio, GObject, GLib
 
-APP_INTERFACE_NAME = "com.github.linkfrg.lst"
-APP_OBJECT_PATH = "/com/github/linkfrg/lst"
+
+CONFIG_EXTENSIONS = (".py", ".scss", ".css")
+IGNORED_PATTERNS = (
+    ".#*",
+    "#*#",
+    "*~",
+    "*.swp",
+    "*.swo",
+    "*.swx",
+    "*.tmp",
+    "*.bak",
+    "*.orig",
+    "4913",
+)
+
 
 class ConfigChangedHandler(FileSystemEventHandler, GObject.Object):
+    """
+    Collects file system events from the watchdog thread and emits ``changed``
+    once on the main loop after no new events arrived for ``delay`` milliseconds.
+    The signal carries the sorted list of changed paths.
+    """
+
     __gsignals__ = {
-        "changed": (GObject.SignalFlags.RUN_FIRST, GObject.TYPE_NONE, ()),
+        "changed": (GObject.SignalFlags.RUN_FIRST, GObject.TYPE_NONE, (object,)),
     }
 
+    def __init__(self, delay: int = 300):
+        FileSystemEventHandler.__init__(self)
+        GObject.Object.__init__(self)
+        self._delay = delay
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._timeout_id = None
+
     def on_modified(self, event):
         self.reload_config(event)
 
@@ -25,10 +59,44 @@ class ConfigChangedHandler(FileSystemEventHandler, GObject.Object):
     def on_deleted(self, event):
         self.reload_config(event)
 
+    def on_moved(self, event):
+        self.reload_config(event)
+
     def reload_config(self, event):
-        if not event.is_directory and "__pycache__" not in event.src_path:
-            if os.path.splitext(event.src_path)[1] in (".py", ".scss", ".css"):
-                self.emit("changed")
+        if event.is_directory:
+            return
+
+        paths = [event.src_path, getattr(event, "dest_path", None)]
+        paths = [p for p in paths if p and self.__is_config_file(p)]
+        if not paths:
+            return
+
+        with self._lock:
+            self._pending.update(paths)
+        GLib.idle_add(self.__restart_timeout)
+
+    def __is_config_file(self, path: str) -> bool:
+        if "__pycache__" in path:
+            return False
+        basename = os.path.basename(path)
+        if any(fnmatch.fnmatch(basename, pattern) for pattern in IGNORED_PATTERNS):
+            return False
+        return os.path.splitext(basename)[1] in CONFIG_EXTENSIONS
+
+    def __restart_timeout(self) -> bool:
+        if self._timeout_id:
+            GLib.source_remove(self._timeout_id)
+        self._timeout_id = GLib.timeout_add(self._delay, self.__flush)
+        return False
+
+    def __flush(self) -> bool:
+        self._timeout_id = None
+        with self._lock:
+            paths = sorted(self._pending)
+            self._pending.clear()
+        if paths:
+            self.emit("changed", paths)
+        return False
 
 
 class LstApp(Gtk.Application):
@@ -49,30 +117,60 @@ class LstApp(Gtk.Application):
             xml=load_interface_xml("com.github.linkfrg.lst.xml"),
         )
 
-        self.__dbus.register_dbus_method(name='OpenWindow', method=self.OpenWindow)
-        self.__dbus.register_dbus_method(name='CloseWindow', method=self.CloseWindow)
-        self.__dbus.register_dbus_method(name='ToggleWindow', method=self.ToggleWindow)
-        self.__dbus.register_dbus_method(name='Quit', method=self.Quit)
-        self.__dbus.register_dbus_method(name='Inspector', method=self.Inspector)
-        self.__dbus.register_dbus_method(name='RunPython', method=self.RunPython)
-        self.__dbus.register_dbus_method(name='RunFile', method=self.RunFile)
-        self.__dbus.register_dbus_method(name='Reload', method=self.Reload)
-        self.__dbus.register_dbus_method(name='ListWindows', method=self.ListWindows)
-
+        self.__dbus.register_dbus_method(name='OpenWindow', method=self.OpenWindow, dispatch="inline")
+        self.__dbus.register_dbus_method(name='CloseWindow', method=self.CloseWindow, dispatch="inline")
+        self.__dbus.register_dbus_method(name='ToggleWindow', method=self.ToggleWindow, dispatch="inline")
+        self.__dbus.register_dbus_method(name='BatchWindows', method=self.BatchWindows, dispatch="inline")
+        self.__dbus.register_dbus_method(name='Quit', method=self.Quit, dispatch="inline")
+        self.__dbus.register_dbus_method(name='Inspector', method=self.Inspector, dispatch="inline")
+        self.__dbus.register_dbus_method(name='RunPython', method=self.RunPython, dispatch="main")
+        self.__dbus.register_dbus_method(name='RunFile', method=self.RunFile, dispatch="main")
+        self.__dbus.register_dbus_method(name='Reload', method=self.Reload, dispatch="inline")
+        self.__dbus.register_dbus_method(name='ListWindows', method=self.ListWindows, dispatch="inline")
 
         self._config_dir = None
         self._config_filename = None
         self._css_provider = None
         self._style_path = None
         self._windows = {}
+        self._hot_reload = True
+        self._reload_delay = 300
 
     @GObject.Property
     def windows(self) -> dict:
         return self._windows
 
-    def setup(self, config_dir: str, config_filename: str) -> None:
+    @GObject.Property
+    def hot_reload(self) -> bool:
+        return self._hot_reload
+
+    @GObject.Property
+    def shared_stylesheet(self) -> bool:
+        return style_sheet.enabled
+
+    @shared_stylesheet.setter
+    def shared_stylesheet(self, value: bool) -> None:
+        style_sheet.enabled = value
+
+    @GObject.Property
+    def suspend_hidden_bindings(self) -> bool:
+        return PropertyBinding.suspend_hidden
+
+    @suspend_hidden_bindings.setter
+    def suspend_hidden_bindings(self, value: bool) -> None:
+        PropertyBinding.suspend_hidden = value
+
+    def setup(
+        self,
+        config_dir: str,
+        config_filename: str,
+        hot_reload: bool = True,
+        reload_delay: int = 300,
+    ) -> None:
         self._config_dir = config_dir
         self._config_filename = config_filename
+        self._hot_reload = hot_reload
+        self._reload_delay = reload_delay
 
     def apply_css(self, style_path: str) -> None:
         self._style_path = style_path
@@ -83,9 +181,9 @@ class LstApp(Gtk.Application):
             screen, self._css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
         )
 
-        compiled_scss = sass.compile(filename=style_path)
-
-        self._css_provider.load_from_data(compiled_scss)
+        with profiler.span(f"apply_css {style_path}", "css"):
+            compiled_scss = compile_scss(style_path)
+            self._css_provider.load_from_data(compiled_scss)
 
     def remove_css(self) -> None:
         if self._css_provider:
@@ -101,19 +199,38 @@ class LstApp(Gtk.Application):
     def do_activate(self) -> None:
         self.hold()
 
-        event_handler = ConfigChangedHandler()
-        event_handler.connect("changed", lambda x: self.reload())
-        observer = Observer()
-        observer.schedule(event_handler, path=self._config_dir, recursive=True)
-        observer.start()
+        with profiler.span("start config watcher"):
+            event_handler = ConfigChangedHandler(delay=self._reload_delay)
+            event_handler.connect("changed", lambda x, paths: self.reload())
+            observer = Observer()
+            observer.schedule(event_handler, path=self._config_dir, recursive=True)
+            observer.start()
 
         sys.path.append(self._config_dir)
+        with profiler.span("do_activate: config import"):
+            self.__import_config()
+
+        if profiler.enabled:
+            GLib.timeout_add_seconds(10, profiler.finish)
+
+    def __import_config(self) -> None:
         try:
-            __import__(self._config_filename)
-            self.emit("ready")
+            with config_scope.activate(self._config_dir):
+                with profiler.imports():
+                    __import__(self._config_filename)
+                with profiler.span("ready handlers"):
+                    self.emit("ready")
         except Exception:
             traceback.print_exc()
 
+    def __purge_config_modules(self) -> None:
+        config_dir = os.path.realpath(self._config_dir) + os.sep
+        for name, module in list(sys.modules.items()):
+            filename = getattr(module, "__file__", None)
+            if filename and os.path.realpath(filename).startswith(config_dir):
+                del sys.modules[name]
+        importlib.invalidate_caches()
+
     def get_window(self, window_name) -> Gtk.Window:
         window = self._windows.get(window_name, None)
         if window:
@@ -137,10 +254,83 @@ class LstApp(Gtk.Application):
             window.visible = not window.visible
             return window.visible
 
+    def batch_windows(self, operations: list) -> None:
+        actions = {
+            "open": self.open_window,
+            "close": self.close_window,
+            "toggle": self.toggle_window,
+        }
+        for action, window_name in operations:
+            func = actions.get(action, None)
+            if func:
+                func(window_name)
+            else:
+                print(f"Unknown window action: {action}")
+
+    def connect(self, signal_name: str, callback: callable, *args) -> int:
+        handler_id = super().connect(signal_name, callback, *args)
+        config_scope.add_handler(self, handler_id, callback, owned=True)
+        return handler_id
+
+    def connect_after(self, signal_name: str, callback: callable, *args) -> int:
+        handler_id = super().connect_after(signal_name, callback, *args)
+        config_scope.add_handler(self, handler_id, callback, owned=True)
+        return handler_id
+
+    def connect_object(self, signal_name: str, callback: callable, *args) -> int:
+        handler_id = super().connect_object(signal_name, callback, *args)
+        config_scope.add_handler(self, handler_id, callback, owned=True)
+        return handler_id
+
+    def connect_object_after(self, signal_name: str, callback: callable, *args) -> int:
+        handler_id = super().connect_object_after(signal_name, callback, *args)
+        config_scope.add_handler(self, handler_id, callback, owned=True)
+        return handler_id
+
+    def timeout_add(self, interval: int, callback: callable, *args) -> int:
+        """
+        ``GLib.timeout_add`` that is removed when the config is reloaded.
+        """
+        source_id = GLib.timeout_add(interval, callback, *args)
+        config_scope.add_source(source_id)
+        return source_id
+
+    def timeout_add_seconds(self, interval: int, callback: callable, *args) -> int:
+        """
+        ``GLib.timeout_add_seconds`` that is removed when the config is reloaded.
+        """
+        source_id = GLib.timeout_add_seconds(interval, callback, *args)
+        config_scope.add_source(source_id)
+        return source_id
+
+    def idle_add(self, callback: callable, *args) -> int:
+        """
+        ``GLib.idle_add`` that is removed when the config is reloaded.
+        """
+        source_id = GLib.idle_add(callback, *args)
+        config_scope.add_source(source_id)
+        return source_id
+
     def add_window(self, window_name: str, window: Gtk.Window) -> None:
         self._windows[window_name] = window
 
     def reload(self) -> None:
+        if not self._hot_reload:
+            self.restart()
+            return
+
+        for window in list(self._windows.values()):
+            window.destroy()
+        self._windows = {}
+        self.remove_css()
+        self._css_provider = None
+
+        # otherwise "ready", service signals, polls and timers of every previous config keep running
+        config_scope.close()
+        self.__purge_config_modules()
+        self.__import_config()
+
+    def restart(self) -> None:
         self.quit()
         os.execl(sys.executable, sys.executable, *sys.argv)
 
@@ -156,6 +346,9 @@ class LstApp(Gtk.Application):
             self.toggle_window(window_name)
         GLib.idle_add(callback)
 
+    def BatchWindows(self, invocation, operations: list) -> None:
+        GLib.idle_add(self.batch_windows, operations)
+
     def RunPython(self, invocation, code: str) -> None:
         eval(code)
 
@@ -165,8 +358,7 @@ class LstApp(Gtk.Application):
             exec(code)
 
     def Reload(self, invocation) -> None:
-        invocation.return_value(None)
-        self.reload()
+        GLib.idle_add(self.reload)
 
     def ListWindows(self, invocation) -> str:
         return GLib.Variant("(as)", (tuple(self._windows),))
@@ -1,5 +1,12 @@
 from gi.repository import GObject, GLib
-from typing import Union
+from lst.binding import live_bindings
+from lst.config_scope import config_scope
+from lst.profiler import profiler
+from typing import Any, Union
+import threading
+
+_queue_lock = threading.Lock()
+
 
 class Binding(GObject.Object):
     def __init__(
@@ -24,21 +31,187 @@ class Binding(GObject.Object):
 
 
 class BaseService(GObject.Object):
+    """
+    Base class for services.
+
+    ``notify`` and ``emit`` may be called from any thread. They are queued and delivered
+    from a single idle callback on the main loop. Within one main loop iteration every
+    property is notified at most once and signals are emitted in the order they were queued.
+
+    Services that set ``notify_changes_only = True`` remember the last value they published
+    for every property. ``notify_all`` and ``refresh`` then only notify properties
+    that have listeners and whose value actually changed.
+    """
+
+    notify_changes_only = False
+
+    __queue = None
+    __dirty = None
+    __published = None
+    __flush_id = None
+
     def __init__(self):
         super().__init__()
 
+    @property
+    def live_bindings(self) -> int:
+        """
+        Number of widget bindings currently connected to this service.
+        """
+        return live_bindings(self)
+
     def bind(self, property_name: str, transform: callable = None) -> Binding:
         return Binding(self, property_name, transform)
 
+    def connect(self, signal_name: str, callback: callable, *args) -> int:
+        handler_id = super().connect(signal_name, callback, *args)
+        config_scope.add_handler(self, handler_id, callback)
+        return handler_id
+
+    def connect_after(self, signal_name: str, callback: callable, *args) -> int:
+        handler_id = super().connect_after(signal_name, callback, *args)
+        config_scope.add_handler(self, handler_id, callback)
+        return handler_id
+
+    def connect_object(self, signal_name: str, callback: callable, *args) -> int:
+        handler_id = super().connect_object(signal_name, callback, *args)
+        config_scope.add_handler(self, handler_id, callback)
+        return handler_id
+
+    def connect_object_after(self, signal_name: str, callback: callable, *args) -> int:
+        handler_id = super().connect_object_after(signal_name, callback, *args)
+        config_scope.add_handler(self, handler_id, callback)
+        return handler_id
+
     def emit(self, signal_name: str, *args):
-        GLib.idle_add(super().emit, signal_name, *args)
+        self.__enqueue("emit", signal_name, args)
 
     def notify(self, property_name: str):
-        GLib.idle_add(super().notify, property_name)
+        self.__enqueue("notify", property_name.replace("_", "-"), None)
 
     def notify_all(self, without: Union[list, str] = None) -> None:
         for i in self.list_properties():
             if without:
                 if i.name in without:
                     continue
-            self.notify(i.name)
+            if self.notify_changes_only:
+                self.__enqueue("refresh", i.name, None)
+            else:
+                self.notify(i.name)
+
+    def refresh(self, *property_names: str) -> None:
+        """
+        Re-read the given properties (all if none are given) and notify the ones
+        whose value differs from the last published one.
+        """
+        if not property_names:
+            property_names = [i.name for i in self.list_properties()]
+        for name in property_names:
+            self.__enqueue("refresh", name.replace("_", "-"), None)
+
+    def __enqueue(self, kind: str, name: str, args: tuple) -> None:
+        with _queue_lock:
+            if self.__queue is None:
+                self.__queue = []
+                self.__dirty = {}
+
+            if kind != "emit":
+                index = self.__dirty.get(name, None)
+                if index is not None:
+                    if kind == "notify":
+                        self.__queue[index] = (kind, name, args)
+                    return
+                self.__dirty[name] = len(self.__queue)
+
+            self.__queue.append((kind, name, args))
+            if not self.__flush_id:
+                self.__flush_id = GLib.idle_add(self.__flush)
+
+    def __flush(self) -> bool:
+        with _queue_lock:
+            queue = self.__queue
+            self.__queue = []
+            self.__dirty = {}
+            self.__flush_id = None
+
+        if self.__published is None:
+            self.__published = {}
+
+        for kind, name, args in queue:
+            if kind == "emit":
+                GObject.Object.emit(self, name, *args)
+            elif kind == "notify":
+                self.__published.pop(name, None)
+                GObject.Object.notify(self, name)
+            elif self.__changed(name):
+                GObject.Object.notify(self, name)
+        return False
+
+    def __changed(self, name: str) -> bool:
+        if not self.__has_listeners(name):
+            self.__published.pop(name, None)
+            return False
+
+        value = self.get_property(name)
+        if name in self.__published:
+            try:
+                if self.__published[name] == value:
+                    return False
+            except Exception:
+                pass
+        self.__published[name] = value
+        return True
+
+    def __has_listeners(self, name: str) -> bool:
+        return GObject.signal_has_handler_pending(
+            self,
+            GObject.signal_lookup("notify", GObject.Object),
+            GLib.quark_from_string(name),
+            False,
+        )
+
+
+class LazyService:
+    """
+    A proxy for a service singleton that builds the real service
+    on first attribute access (including ``connect`` and ``bind``).
+    """
+
+    def __init__(self, factory: callable):
+        self.__dict__["_LazyService__factory"] = factory
+        self.__dict__["_LazyService__instance"] = None
+        self.__dict__["_LazyService__lock"] = threading.RLock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.__instance is not None
+
+    def load(self) -> BaseService:
+        if self.__instance is None:
+            with self.__lock:
+                if self.__instance is None:
+                    name = getattr(self.__factory, "__name__", repr(self.__factory))
+                    with profiler.span(name, "service"):
+                        self.__dict__["_LazyService__instance"] = self.__factory()
+        return self.__instance
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.load(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.load(), name, value)
+
+    def __repr__(self) -> str:
+        if self.__instance is None:
+            return f"<LazyService {getattr(self.__factory, '__name__', self.__factory)} (not loaded)>"
+        return repr(self.__instance)
+
+
+def preload(*services: LazyService) -> None:
+    """
+    Build the given lazy services right away, e.g. ``preload(notifications, system_tray)``
+    for services that must own their D-Bus name before anything uses them.
+    """
+    for service in services:
+        if isinstance(service, LazyService):
+            service.load()
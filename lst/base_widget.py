@@ -1,7 +1,8 @@
 from gi.repository import Gtk, GObject
-from lst.base_service import Binding
+from lst.base_service import Binding, LazyService
+from lst.binding import PropertyBinding
+from lst.style import style_cache, style_sheet
 from typing import Any
-import sass
 
 ALIGN = {
     "start": Gtk.Align.START,
@@ -11,6 +12,23 @@ ALIGN = {
     "baseline": Gtk.Align.BASELINE,
 }
 
+_PROPERTY_NAMES = {}
+
+
+def _property_names(cls: type, instance: GObject.Object) -> frozenset:
+    """
+    GObject property names of ``cls`` in both ``dash-case`` and ``snake_case``,
+    collected once per class so the attribute hooks below don't go through introspection on every access.
+    """
+    names = _PROPERTY_NAMES.get(cls, None)
+    if names is None:
+        names = set()
+        for pspec in instance.list_properties():
+            names.add(pspec.name)
+            names.add(pspec.name.replace("-", "_"))
+        names = _PROPERTY_NAMES[cls] = frozenset(names)
+    return names
+
 
 class BaseWidget(Gtk.Widget):
     """
@@ -31,6 +49,7 @@ class BaseWidget(Gtk.Widget):
         height_request(``int``, optional): Height of the widget.
     """
     gproperties = __gproperties__ = {}
+    _bindings = None
 
     def __init__(
         self,
@@ -52,6 +71,8 @@ class BaseWidget(Gtk.Widget):
         self._class_name = None
         self._style = None
         self._css_provider = None
+        self._style_class = None
+        self._style_handler = None
 
         self.class_name = class_name
         self.valign = valign
@@ -81,6 +102,8 @@ class BaseWidget(Gtk.Widget):
 
             for name in value.split(" "):
                 style_context.add_class(name)
+            if self._style_class:
+                style_context.add_class(self._style_class)
 
             self._class_name = value
 
@@ -112,19 +135,35 @@ class BaseWidget(Gtk.Widget):
 
     @style.setter
     def style(self, value: str) -> None:
-        if value:
-            css_provider = Gtk.CssProvider()
-            style_formated = sass.compile(string="* {" + value + "}")
-            css_provider.load_from_data(style_formated.encode())
-
-            self.get_style_context().add_provider(
-                css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-            )
-            if self._css_provider:
-                self.get_style_context().remove_provider(self._css_provider)
-            self._css_provider = css_provider
+        if value and value != self._style:
+            self.__release_style()
+
+            if style_sheet.enabled:
+                self._style_class = style_sheet.acquire(value)
+                self.get_style_context().add_class(self._style_class)
+            else:
+                self._css_provider = style_cache.acquire(value)
+                self.get_style_context().add_provider(
+                    self._css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+                )
+
+            if not self._style_handler:
+                self._style_handler = self.connect(
+                    "destroy", lambda x: self.__release_style()
+                )
             self._style = value
 
+    def __release_style(self) -> None:
+        if self._css_provider:
+            self.get_style_context().remove_provider(self._css_provider)
+            style_cache.release(self._style)
+            self._css_provider = None
+
+        if self._style_class:
+            self.get_style_context().remove_class(self._style_class)
+            style_sheet.release(self._style)
+            self._style_class = None
+
     def set_property(self, property_name: str, value: Any) -> None:
         """
         :meta private:
@@ -140,24 +179,24 @@ class BaseWidget(Gtk.Widget):
 
     def __getattribute__(self, name: str) -> Any:
         if name.startswith("set_") and name != "set_property":
-            property_name = name.replace('set_', '')
-            if self.find_property(property_name):
+            property_name = name[4:]
+            if property_name in _property_names(type(self), self):
                 return lambda value: self.set_property(property_name, value)
         return super().__getattribute__(name)
 
     def __setattr__(self, name: str, value: Any) -> None:
-        if self.find_property(name):
+        if name in _property_names(type(self), self):
             self.set_property(name, value)
         else:
             super().__setattr__(name, value)
     
     def __getattr__(self, name: str) -> Any:
-        if self.find_property(name):
+        if name in _property_names(type(self), self):
             return self.get_property(name)
         else:
             super().__getattribute__(name)
 
-    def bind_property(self, source_property: str, target: GObject.Object, target_property: str, transform: callable = None) -> None:
+    def bind_property(self, source_property: str, target: GObject.Object, target_property: str, transform: callable = None) -> PropertyBinding:
         """
         Bind ``source_property`` on ``self`` with ``target_property`` on ``target``.
 
@@ -166,15 +205,16 @@ class BaseWidget(Gtk.Widget):
             target (``GObject.Object``): the target ``GObject.Object``.
             target_property (``str``): the property on ``target`` to bind.
             transform (``callable``): The function that accepts a new property value and returns the processed value.
+        Returns:
+            :class:`~lst.binding.PropertyBinding`
         """
-        def callback(*args):
-            value = target.get_property(target_property.replace('-', '_'))
-            if transform:
-                value = transform(value)
-            self.set_property(source_property, value)
-
-        target.connect(f"notify::{target_property.replace('_', '-')}", callback)
-        callback()
+        if isinstance(target, LazyService):
+            target = target.load()
+        binding = PropertyBinding(self, source_property, target, target_property, transform)
+        if self._bindings is None:
+            self._bindings = []
+        self._bindings.append(binding)
+        return binding
 
     def bind(self, property_name: str, transform: callable = None) -> Binding:
         """
@@ -0,0 +1,192 @@
+import time
+import weakref
+from gi.repository import GObject
+from typing import Any, List
+
+MUTABLE_TYPES = (list, dict, set, bytearray)
+# bindings that decide whether the widget is shown must never be suspended
+ALWAYS_LIVE_PROPERTIES = ("visible", "reveal_child")
+
+_bindings = weakref.WeakSet()
+_live = weakref.WeakKeyDictionary()
+
+
+def same_value(old: Any, new: Any) -> bool:
+    if old is new:
+        # a mutable object may have been changed in place
+        return not isinstance(new, MUTABLE_TYPES)
+    try:
+        return bool(old == new)
+    except Exception:
+        return False
+
+
+class PropertyBinding:
+    """
+    Keeps ``widget_property`` on ``widget`` in sync with ``target_property`` on ``target``.
+
+    Only a weak reference to ``widget`` is held. The binding disconnects from ``target``
+    when the widget is destroyed or garbage collected, so a dropped widget is neither kept
+    alive by the service nor updated by it.
+
+    The last value read from ``target`` and the last transformed value are cached:
+    if the value did not change, ``transform`` is not called, and if the transformed
+    value did not change, the widget is not updated.
+
+    When ``PropertyBinding.suspend_hidden`` is enabled, notifications that arrive while
+    the widget is not mapped (its window is hidden or it sits in a collapsed ``Revealer``)
+    only mark the binding dirty. The latest value is applied once when the widget is mapped again.
+
+    Counters:
+        updates: How many times the widget property was set.
+        hits: Notifications skipped because the target value did not change.
+        skips: Transforms whose result was equal to the previous one, so the widget was not touched.
+        suspended: Notifications deferred because the widget was not mapped.
+        transform_time: Total seconds spent in ``transform``.
+    """
+
+    suspend_hidden = False
+
+    def __init__(
+        self,
+        widget: GObject.Object,
+        widget_property: str,
+        target: GObject.Object,
+        target_property: str,
+        transform: callable = None,
+    ):
+        self._widget = weakref.ref(widget)
+        self._widget_property = widget_property
+        self._target = target
+        self._target_property = target_property.replace("-", "_")
+        self._transform = transform
+
+        self._value = None
+        self._result = None
+        self._has_value = False
+        self._has_result = False
+        self._dirty = False
+        self._suspendable = (
+            widget_property.replace("-", "_") not in ALWAYS_LIVE_PROPERTIES
+        )
+
+        self.updates = 0
+        self.hits = 0
+        self.skips = 0
+        self.suspended = 0
+        self.transform_time = 0.0
+
+        self._handler_id = target.connect(
+            f"notify::{target_property.replace('_', '-')}", self.__on_notify
+        )
+        _bindings.add(self)
+        _live[target] = _live.get(target, 0) + 1
+        widget.connect("destroy", lambda *args: self.unbind())
+        if self._suspendable:
+            widget.connect("map", lambda *args: self.__on_map())
+        self.update(force=True)
+
+    @property
+    def widget(self) -> GObject.Object:
+        return self._widget()
+
+    @property
+    def is_bound(self) -> bool:
+        return self._handler_id is not None
+
+    @property
+    def widget_property(self) -> str:
+        return self._widget_property
+
+    @property
+    def target(self) -> GObject.Object:
+        return self._target
+
+    @property
+    def target_property(self) -> str:
+        return self._target_property
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "widget": type(self._widget()).__name__,
+            "widget_property": self._widget_property,
+            "target": type(self._target).__name__,
+            "target_property": self._target_property,
+            "updates": self.updates,
+            "hits": self.hits,
+            "skips": self.skips,
+            "suspended": self.suspended,
+            "transform_time": self.transform_time,
+        }
+
+    def unbind(self) -> None:
+        if self._handler_id is None:
+            return
+        self._target.disconnect(self._handler_id)
+        self._handler_id = None
+        count = _live.get(self._target, 0) - 1
+        if count > 0:
+            _live[self._target] = count
+        else:
+            _live.pop(self._target, None)
+        self._value = self._result = None
+
+    def __on_notify(self, *args) -> None:
+        if self.suspend_hidden and self._suspendable:
+            widget = self._widget()
+            if widget is not None and not widget.get_mapped():
+                self._dirty = True
+                self.suspended += 1
+                return
+        self.update()
+
+    def __on_map(self) -> None:
+        if self._dirty:
+            self._dirty = False
+            self.update()
+
+    def update(self, force: bool = False) -> None:
+        widget = self._widget()
+        if widget is None:
+            self.unbind()
+            return
+
+        value = self._target.get_property(self._target_property)
+        if not force and self._has_value and same_value(self._value, value):
+            self.hits += 1
+            return
+        self._value = value
+        self._has_value = True
+
+        if self._transform:
+            start = time.perf_counter()
+            value = self._transform(value)
+            self.transform_time += time.perf_counter() - start
+
+        if not force and self._has_result and same_value(self._result, value):
+            self.skips += 1
+            return
+        self._result = value
+        self._has_result = True
+
+        self.updates += 1
+        widget.set_property(self._widget_property, value)
+
+
+def live_bindings(target: GObject.Object) -> int:
+    """
+    Return how many bindings are currently connected to ``target``.
+    """
+    return _live.get(target, 0)
+
+
+def binding_stats() -> List[dict]:
+    """
+    Return the counters of every live binding, most updated first.
+    """
+    return sorted(
+        (binding.stats for binding in list(_bindings) if binding.is_bound),
+        key=lambda x: x["updates"],
+        reverse=True,
+    )
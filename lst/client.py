@@ -1,76 +1,87 @@
-from lst.dbus import DbusClient
-from lst.app import APP_INTERFACE_NAME, APP_OBJECT_PATH
-from gi.repository import GLib
+from gi.repository import Gio, GLib
+
+APP_INTERFACE_NAME = "com.github.linkfrg.lst"
+APP_OBJECT_PATH = "/com/github/linkfrg/lst"
 
 
 class LstClient:
-    def __init__(self):
-        self.__dbus = DbusClient(
-            name=APP_INTERFACE_NAME,
-            object_path=APP_OBJECT_PATH,
-            interface_name=APP_INTERFACE_NAME,
-        )
+    """
+    Talks to a running lst instance over the session bus.
 
-    def OpenWindow(self, window: str) -> None:
-        self.__dbus.call_sync(
-            method_name="OpenWindow",
-            parameters=GLib.Variant(
-                "(s)",
-                (window,),
-            ),
-        )
+    Uses the bare ``Gio.DBusConnection`` instead of a ``Gio.DBusProxy`` so no
+    introspection or property round trip is done, and only imports Gio/GLib so the
+    CLI does not pay for GTK, libsass or the app module.
+    Window commands are sent fire-and-forget (``NO_REPLY_EXPECTED``) unless ``wait=True``.
+    """
+
+    def __init__(self, connection: Gio.DBusConnection = None):
+        if connection is None:
+            connection = Gio.bus_get_sync(Gio.BusType.SESSION, None)
+        self.__connection = connection
 
-    def CloseWindow(self, window: str) -> None:
-        self.__dbus.call_sync(
-            method_name="CloseWindow",
-            parameters=GLib.Variant(
-                "(s)",
-                (window,),
-            ),
+    def __call(
+        self,
+        method_name: str,
+        parameters: GLib.Variant = None,
+        reply_type: GLib.VariantType = None,
+    ) -> GLib.Variant:
+        return self.__connection.call_sync(
+            APP_INTERFACE_NAME,
+            APP_OBJECT_PATH,
+            APP_INTERFACE_NAME,
+            method_name,
+            parameters,
+            reply_type,
+            Gio.DBusCallFlags.NONE,
+            -1,
+            None,
         )
 
-    def ToggleWindow(self, window: str) -> None:
-        self.__dbus.call_sync(
-            method_name="ToggleWindow",
-            parameters=GLib.Variant(
-                "(s)",
-                (window,),
-            ),
+    def __send(self, method_name: str, parameters: GLib.Variant = None, wait: bool = False) -> None:
+        if wait:
+            self.__call(method_name, parameters)
+            return
+
+        message = Gio.DBusMessage.new_method_call(
+            APP_INTERFACE_NAME, APP_OBJECT_PATH, APP_INTERFACE_NAME, method_name
         )
+        if parameters is not None:
+            message.set_body(parameters)
+        message.set_flags(Gio.DBusMessageFlags.NO_REPLY_EXPECTED)
+        self.__connection.send_message(message, Gio.DBusSendMessageFlags.NONE)
+        self.__connection.flush_sync(None)
+
+    def OpenWindow(self, window: str, wait: bool = False) -> None:
+        self.__send("OpenWindow", GLib.Variant("(s)", (window,)), wait)
+
+    def CloseWindow(self, window: str, wait: bool = False) -> None:
+        self.__send("CloseWindow", GLib.Variant("(s)", (window,)), wait)
+
+    def ToggleWindow(self, window: str, wait: bool = False) -> None:
+        self.__send("ToggleWindow", GLib.Variant("(s)", (window,)), wait)
+
+    def BatchWindows(self, operations: list, wait: bool = False) -> None:
+        """
+        Apply a list of ``(action, window)`` pairs in one call, where action is
+        ``"open"``, ``"close"`` or ``"toggle"``. The server applies them in a single main loop iteration.
+        """
+        self.__send("BatchWindows", GLib.Variant("(a(ss))", (operations,)), wait)
 
     def ListWindows(self) -> None:
-        response = self.__dbus.call_sync(
-            method_name="ListWindows",
-        )
-        print('\n'.join(response[0]))
+        response = self.__call("ListWindows", reply_type=GLib.VariantType("(as)"))
+        print('\n'.join(response.unpack()[0]))
 
-    def Quit(self) -> None:
-        self.__dbus.call_sync(
-            method_name="Quit",
-        )
+    def Quit(self, wait: bool = False) -> None:
+        self.__send("Quit", wait=wait)
 
-    def Inspector(self) -> None:
-        self.__dbus.call_sync(
-            method_name="Inspector",
-        )
+    def Inspector(self, wait: bool = False) -> None:
+        self.__send("Inspector", wait=wait)
 
     def RunPython(self, code: str) -> None:
-        self.__dbus.call_sync(
-            method_name="RunPython",
-            parameters=GLib.Variant(
-                "(s)",
-                (code,),
-            ),
-        )
+        self.__call("RunPython", GLib.Variant("(s)", (code,)))
 
     def RunFile(self, path: str) -> None:
-        self.__dbus.call_sync(
-            method_name="RunFile",
-            parameters=GLib.Variant(
-                "(s)",
-                (path,),
-            ),
-        )
+        self.__call("RunFile", GLib.Variant("(s)", (path,)))
 
-    def Reload(self) -> None:
-        self.__dbus.call_sync(method_name="Reload")
+    def Reload(self, wait: bool = False) -> None:
+        self.__send("Reload", wait=wait)
@@ -0,0 +1,126 @@
+import contextlib
+import os
+import threading
+import weakref
+from gi.repository import GObject, GLib
+
+LST_DIR = os.path.dirname(os.path.realpath(__file__)) + os.sep
+
+
+class ConfigScope:
+    """
+    Remembers what the user config attached to objects that outlive it, so a hot reload
+    can detach the previous config before importing the new one.
+
+    ``LstApp.connect`` and ``BaseService.connect`` report their handlers here, ``Poll`` reports
+    itself and ``LstApp.timeout_add``, ``timeout_add_seconds`` and ``idle_add`` report their sources.
+    ``Poll`` instances are owned by the config if they were created while it was being imported
+    or their callback is defined in it; sources added through the app always are. A handler is
+    owned by the config if its callback is defined in the config directory, or, for handlers
+    on the app, if it was connected from outside lst while the config was being imported on the importing thread.
+    """
+
+    def __init__(self):
+        self._config_dir = None
+        self._thread = None
+        self._handlers = []
+        self._prune_at = 64
+        self._in_config = {}
+        self._lock = threading.Lock()
+        self._sources = []
+        self._polls = weakref.WeakSet()
+
+    @property
+    def active(self) -> bool:
+        """
+        Whether the config is being imported on the calling thread.
+        """
+        return self._thread is not None and self._thread == threading.get_ident()
+
+    @contextlib.contextmanager
+    def activate(self, config_dir: str):
+        self._config_dir = os.path.realpath(config_dir) + os.sep
+        self._in_config = {}
+        self._thread = threading.get_ident()
+        try:
+            yield
+        finally:
+            self._thread = None
+
+    def is_config_callback(self, callback: callable) -> bool:
+        return self.__get_origin(callback) == "config"
+
+    def __get_origin(self, callback: callable) -> str:
+        code = getattr(getattr(callback, "__func__", callback), "__code__", None)
+        if code is None or self._config_dir is None:
+            return None
+        filename = code.co_filename
+        if filename not in self._in_config:
+            path = os.path.realpath(filename)
+            if path.startswith(self._config_dir):
+                self._in_config[filename] = "config"
+            elif path.startswith(LST_DIR):
+                self._in_config[filename] = "lst"
+            else:
+                self._in_config[filename] = None
+        return self._in_config[filename]
+
+    def add_handler(
+        self,
+        obj: GObject.Object,
+        handler_id: int,
+        callback: callable,
+        owned: bool = False,
+    ) -> None:
+        origin = self.__get_origin(callback)
+        # lst's own handlers (e.g. services loaded by the config) stay connected
+        if origin != "config" and not (owned and self.active and origin != "lst"):
+            return
+        with self._lock:
+            self._handlers.append((weakref.ref(obj), handler_id))
+            if len(self._handlers) >= self._prune_at:
+                # handlers on objects that are gone (e.g. closed notifications) need no disconnect
+                self._handlers = [h for h in self._handlers if h[0]() is not None]
+                self._prune_at = max(64, len(self._handlers) * 2)
+
+    def add_source(self, source_id: int) -> None:
+        with self._lock:
+            self._sources.append(source_id)
+            if len(self._sources) >= 64:
+                context = GLib.MainContext.default()
+                self._sources = [
+                    i for i in self._sources if context.find_source_by_id(i)
+                ]
+
+    def add_poll(self, poll: GObject.Object, callback: callable) -> None:
+        if self.active or self.is_config_callback(callback):
+            with self._lock:
+                self._polls.add(poll)
+
+    def close(self) -> None:
+        """
+        Disconnect, remove and cancel everything the current config generation owns.
+        """
+        with self._lock:
+            handlers = self._handlers
+            sources = self._sources
+            polls = list(self._polls)
+            self._handlers = []
+            self._sources = []
+            self._polls = weakref.WeakSet()
+            self._prune_at = 64
+
+        for poll in polls:
+            poll.cancel()
+
+        context = GLib.MainContext.default()
+        for source_id in sources:
+            if context.find_source_by_id(source_id):
+                GLib.source_remove(source_id)
+        for ref, handler_id in handlers:
+            obj = ref()
+            if obj is not None and GObject.signal_handler_is_connected(obj, handler_id):
+                obj.disconnect(handler_id)
+
+
+config_scope = ConfigScope()
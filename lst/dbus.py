@@ -1,5 +1,25 @@
 from gi.repository import Gio, GLib, GObject
+from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict
+import os
 import threading
+import traceback
+
+DISPATCH = ("main", "pool", "inline")
+WORKER_POOL_SIZE = min(4, os.cpu_count() or 1)
+
+_worker_pool = None
+_worker_pool_lock = threading.Lock()
+
+
+def get_worker_pool() -> ThreadPoolExecutor:
+    global _worker_pool
+    with _worker_pool_lock:
+        if _worker_pool is None:
+            _worker_pool = ThreadPoolExecutor(
+                max_workers=WORKER_POOL_SIZE, thread_name_prefix="lst-dbus"
+            )
+    return _worker_pool
 
 
 class DbusService(GObject.Object):
@@ -25,7 +45,10 @@ class DbusService(GObject.Object):
         self._object_path = object_path
 
         self._methods = {}
+        self._dispatch = {}
         self._properties = {}
+        self._pending = defaultdict(int)
+        self._pending_lock = threading.Lock()
 
     @GObject.Property
     def name(self) -> str:
@@ -47,6 +70,10 @@ class DbusService(GObject.Object):
     def properties(self) -> dict:
         return self._properties
 
+    @GObject.Property
+    def pending(self) -> dict:
+        return dict(self._pending)
+
     def __export_object(self, connection, xml) -> None:
         self._connection = connection
         node = Gio.DBusNodeInfo.new_for_xml(xml)
@@ -68,21 +95,71 @@ class DbusService(GObject.Object):
         params,
         invocation,
     ):
-        def callback(func):
-            result = func(invocation, *params)
-            invocation.return_value(result)
-
         func = self._methods.get(method_name, None)
-        if func:
-            threading.Thread(target=lambda: callback(func)).start()
+        if not func:
+            return
+
+        dispatch, max_pending = self._dispatch[method_name]
+        if dispatch == "inline":
+            self.__invoke(func, invocation, params)
+            return
+
+        with self._pending_lock:
+            if self._pending[method_name] >= max_pending:
+                invocation.return_dbus_error(
+                    "org.freedesktop.DBus.Error.LimitsExceeded",
+                    f"Too many pending {method_name} calls",
+                )
+                return
+            self._pending[method_name] += 1
+
+        if dispatch == "main":
+            GLib.idle_add(self.__run, method_name, func, invocation, params)
+        else:
+            get_worker_pool().submit(self.__run, method_name, func, invocation, params)
+
+    def __run(self, method_name, func, invocation, params) -> bool:
+        try:
+            self.__invoke(func, invocation, params)
+        finally:
+            with self._pending_lock:
+                self._pending[method_name] -= 1
+        return False
+
+    def __invoke(self, func, invocation, params) -> None:
+        try:
+            result = func(invocation, *params)
+        except Exception as e:
+            traceback.print_exc()
+            invocation.return_dbus_error("org.freedesktop.DBus.Error.Failed", str(e))
+            return
+        invocation.return_value(result)
 
     def __handle_get_property(self, connection, sender, object_path, interface, value):
         func = self._properties.get(value, None)
         if func:
             return func()
 
-    def register_dbus_method(self, name: str, method: callable) -> None:
+    def register_dbus_method(
+        self,
+        name: str,
+        method: callable,
+        dispatch: str = "pool",
+        max_pending: int = 64,
+    ) -> None:
+        """
+        Register a handler for an incoming method call.
+
+        ``dispatch`` selects where the handler runs: ``"main"`` schedules it on the GLib main loop,
+        ``"pool"`` runs it on the shared bounded worker pool and ``"inline"`` calls it
+        directly from the D-Bus dispatch callback. For ``"main"`` and ``"pool"`` at most
+        ``max_pending`` calls may be queued; further calls are rejected with
+        ``org.freedesktop.DBus.Error.LimitsExceeded``.
+        """
+        if dispatch not in DISPATCH:
+            raise ValueError(f"Unknown dispatch mode: {dispatch}")
         self._methods[name] = method
+        self._dispatch[name] = (dispatch, max_pending)
 
     def register_dbus_property(self, name: str, method: callable) -> None:
         self._properties[name] = method
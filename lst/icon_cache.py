@@ -0,0 +1,144 @@
+import weakref
+from collections import OrderedDict, deque
+from gi.repository import Gtk, GdkPixbuf, GObject, GLib
+from typing import Iterable, Optional
+
+
+class IconCache(GObject.Object):
+    """
+    Process-wide cache of icon theme lookups.
+
+    The resolved ``Gtk.IconInfo`` and the rendered pixbuf are cached per ``(name, size, scale)``,
+    including names the theme does not have. Least recently used entries are evicted once
+    there are more than ``max_size`` entries.
+
+    The cache is cleared and ``changed`` is emitted when the default icon theme changes.
+    Widgets registered with ``track`` are only referenced weakly and get their
+    ``_refresh_icon`` method called after the cache is cleared.
+    """
+
+    __gsignals__ = {
+        "changed": (GObject.SignalFlags.RUN_FIRST, GObject.TYPE_NONE, ()),
+    }
+
+    PREFETCH_BATCH = 16
+
+    def __init__(self, max_size: int = 1024):
+        super().__init__()
+        self._max_size = max_size
+        self._entries = OrderedDict()
+        self._theme = None
+        self._prefetch = deque()
+        self._prefetch_id = None
+        self._widgets = weakref.WeakSet()
+        self._hits = 0
+        self._lookups = 0
+
+    @GObject.Property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value: int) -> None:
+        self._max_size = value
+        self.__evict()
+
+    @GObject.Property
+    def hits(self) -> int:
+        return self._hits
+
+    @GObject.Property
+    def lookups(self) -> int:
+        return self._lookups
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def theme(self) -> Gtk.IconTheme:
+        if self._theme is None:
+            self._theme = Gtk.IconTheme.get_default()
+            self._theme.connect("changed", lambda *args: self.__on_theme_changed())
+        return self._theme
+
+    def lookup(self, name: str, size: int, scale: int = 1) -> Optional[Gtk.IconInfo]:
+        """
+        Return the ``Gtk.IconInfo`` for ``name``, or ``None`` if the theme has no such icon.
+        """
+        return self.__get_entry(name, size, scale)[0]
+
+    def load(self, name: str, size: int, scale: int = 1) -> Optional[GdkPixbuf.Pixbuf]:
+        """
+        Return ``name`` rendered at ``size * scale`` pixels, or ``None`` if the theme has no such icon.
+        """
+        entry = self.__get_entry(name, size, scale)
+        if entry[0] is not None and entry[1] is None:
+            try:
+                entry[1] = entry[0].load_icon()
+            except GLib.Error as e:
+                print(f"Failed to load icon {name}: {e}")
+                entry[0] = None
+        return entry[1]
+
+    def prefetch(self, names: Iterable[str], size: int, scale: int = 1) -> None:
+        """
+        Render the given icons in idle time, a few per main loop iteration,
+        e.g. ``icon_cache.prefetch([app.icon for app in applications.apps], 32)``.
+        """
+        self._prefetch.extend((name, size, scale) for name in names if name)
+        if self._prefetch and not self._prefetch_id:
+            self._prefetch_id = GLib.idle_add(
+                self.__prefetch_step, priority=GLib.PRIORITY_LOW
+            )
+
+    def track(self, widget: GObject.Object) -> None:
+        """
+        Re-render ``widget`` when the icon theme changes, without keeping it alive.
+        """
+        self._widgets.add(widget)
+
+    def untrack(self, widget: GObject.Object) -> None:
+        self._widgets.discard(widget)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __get_entry(self, name: str, size: int, scale: int) -> list:
+        key = (name, size, scale)
+        entry = self._entries.get(key, None)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry
+
+        self._lookups += 1
+        info = self.theme.lookup_icon_for_scale(
+            name, size, scale, Gtk.IconLookupFlags.FORCE_SIZE
+        )
+        entry = self._entries[key] = [info, None]
+        self.__evict()
+        return entry
+
+    def __prefetch_step(self) -> bool:
+        for _ in range(self.PREFETCH_BATCH):
+            if not self._prefetch:
+                self._prefetch_id = None
+                return False
+            self.load(*self._prefetch.popleft())
+        if self._prefetch:
+            return True
+        self._prefetch_id = None
+        return False
+
+    def __on_theme_changed(self) -> None:
+        self.clear()
+        for widget in list(self._widgets):
+            widget._refresh_icon()
+        self.emit("changed")
+
+    def __evict(self) -> None:
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+
+icon_cache = IconCache()
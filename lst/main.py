@@ -1,8 +1,17 @@
 import argparse
 import os
-from lst.app import app, APP_INTERFACE_NAME
-from gi.repository import Gio, GLib 
-from lst.client import LstClient
+from lst.profiler import profiler
+from lst.client import LstClient, APP_INTERFACE_NAME
+from gi.repository import Gio, GLib
+
+STARTUP_TRACE_FILE = f"{GLib.get_user_cache_dir()}/lst/startup-trace.json"
+
+
+class WindowOperationAction(argparse.Action):
+    def __call__(self, parser, namespace, values, option_string=None):
+        operations = getattr(namespace, self.dest, None) or []
+        operations.append((self.const, values))
+        setattr(namespace, self.dest, operations)
 
 
 def parse_arguments():
@@ -16,17 +25,26 @@ def parse_arguments():
     parser.add_argument(
         "--open",
         metavar="WINDOW",
-        help="Open a window",
+        dest="window_operations",
+        action=WindowOperationAction,
+        const="open",
+        help="Open a window (can be repeated)",
     )
     parser.add_argument(
         "--close",
         metavar="WINDOW",
-        help="Close a window",
+        dest="window_operations",
+        action=WindowOperationAction,
+        const="close",
+        help="Close a window (can be repeated)",
     )
     parser.add_argument(
         "--toggle",
         metavar="WINDOW",
-        help="Toggle a window",
+        dest="window_operations",
+        action=WindowOperationAction,
+        const="toggle",
+        help="Toggle a window (can be repeated)",
     )
     parser.add_argument(
         "--list-windows",
@@ -53,6 +71,25 @@ def parse_arguments():
         action="store_true",
         help="Reload LST",
     )
+    parser.add_argument(
+        "--full-reload",
+        action="store_true",
+        help="Restart the whole process on reload instead of re-importing the config",
+    )
+    parser.add_argument(
+        "--reload-delay",
+        metavar="MS",
+        type=int,
+        default=300,
+        help="Quiet period in milliseconds to wait for config changes to settle before reloading (default: 300)",
+    )
+    parser.add_argument(
+        "--profile-startup",
+        metavar="TRACE_FILE",
+        nargs="?",
+        const=STARTUP_TRACE_FILE,
+        help=f"Print a startup timing report and write a Chrome trace file (default: {STARTUP_TRACE_FILE})",
+    )
     parser.add_argument(
         "--quit",
         action="store_true",
@@ -69,31 +106,41 @@ def parse_arguments():
 
 def main():
     args = parse_arguments()
-    bus = Gio.bus_get_sync(Gio.BusType.SESSION, None)
-    result = bus.call_sync(
-        "org.freedesktop.DBus",
-        "/org/freedesktop/DBus",
-        "org.freedesktop.DBus",
-        "NameHasOwner",
-        GLib.Variant("(s)", (APP_INTERFACE_NAME,)),
-        GLib.VariantType("(b)"),
-        Gio.DBusCallFlags.NONE,
-        -1,
-        None,
-    ).unpack()[0]
+    if args.profile_startup:
+        profiler.start(args.profile_startup)
+
+    with profiler.span("check running instance"):
+        bus = Gio.bus_get_sync(Gio.BusType.SESSION, None)
+        result = bus.call_sync(
+            "org.freedesktop.DBus",
+            "/org/freedesktop/DBus",
+            "org.freedesktop.DBus",
+            "NameHasOwner",
+            GLib.Variant("(s)", (APP_INTERFACE_NAME,)),
+            GLib.VariantType("(b)"),
+            Gio.DBusCallFlags.NONE,
+            -1,
+            None,
+        ).unpack()[0]
 
     if not result:
-        run_server(args.config)
+        run_server(
+            args.config,
+            hot_reload=not args.full_reload,
+            reload_delay=args.reload_delay,
+        )
     else:
-        client = LstClient()
-        if args.open:
-            client.OpenWindow(args.open)
-
-        elif args.close:
-            client.CloseWindow(args.close)
-
-        elif args.toggle:
-            client.ToggleWindow(args.toggle)
+        client = LstClient(bus)
+        if args.window_operations:
+            if len(args.window_operations) == 1:
+                action, window = args.window_operations[0]
+                {
+                    "open": client.OpenWindow,
+                    "close": client.CloseWindow,
+                    "toggle": client.ToggleWindow,
+                }[action](window)
+            else:
+                client.BatchWindows(args.window_operations)
 
         elif args.list_windows:
             client.ListWindows()
@@ -121,13 +168,17 @@ def main():
             exit(1)
 
 
-def run_server(config):
+def run_server(config, hot_reload=True, reload_delay=300):
     config_path = os.path.expanduser(config)
 
     config_dir = os.path.dirname(config_path)
     config_filename = os.path.splitext(os.path.basename(config_path))[0]
 
-    app.setup(config_dir, config_filename)
+    with profiler.span("import lst.app (GTK, GI typelibs, D-Bus)"):
+        from lst.app import app
+
+    app.setup(config_dir, config_filename, hot_reload, reload_delay)
+    profiler.mark("app.run")
 
     try:
         app.run(None)
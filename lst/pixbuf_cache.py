@@ -0,0 +1,158 @@
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from gi.repository import GdkPixbuf, GLib
+from typing import Tuple
+
+DECODE_POOL_SIZE = min(2, os.cpu_count() or 1)
+
+
+class PixbufCache:
+    """
+    Process-wide cache of decoded and scaled images.
+
+    Entries are keyed by ``(path, mtime, width, height, scale)``, so an image file is decoded and
+    scaled once per logical size and monitor scale factor, and a file that changed on disk is decoded again.
+    Images on monitors with the same scale factor share the decoded data.
+    Least recently used entries are evicted once the pixel data of all entries
+    takes more than ``max_bytes``.
+
+    ``load`` may be called from any thread. ``load_async`` decodes on a small worker pool
+    and calls back on the main loop.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._decodes = 0
+        self._lock = threading.Lock()
+        self._pool = None
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        with self._lock:
+            self._max_bytes = value
+            self.__evict()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def decodes(self) -> int:
+        return self._decodes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_key(
+        self, path: str, width: int, height: int, scale: int = 1
+    ) -> Tuple[str, int, int, int, int]:
+        return (path, os.stat(path).st_mtime_ns, width, height, scale)
+
+    def load(
+        self, path: str, width: int = -1, height: int = -1, scale: int = 1
+    ) -> GdkPixbuf.Pixbuf:
+        """
+        Return the image at ``path`` scaled to ``width`` x ``height`` logical pixels,
+        i.e. ``width * scale`` x ``height * scale`` device pixels.
+        ``-1`` keeps the original size in that dimension.
+        """
+        key = self.get_key(path, width, height, scale)
+        pixbuf = self.__lookup(key)
+        if pixbuf is not None:
+            return pixbuf
+
+        # decode and scale in one pass instead of decoding at full size and scaling afterwards
+        pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
+            path,
+            width * scale if width != -1 else -1,
+            height * scale if height != -1 else -1,
+            False,
+        )
+        with self._lock:
+            self._decodes += 1
+            self.__add(key, pixbuf)
+        return pixbuf
+
+    def lookup(
+        self, path: str, width: int = -1, height: int = -1, scale: int = 1
+    ) -> GdkPixbuf.Pixbuf:
+        """
+        Return the cached image, or ``None`` if it was not decoded at this size yet.
+        """
+        try:
+            return self.__lookup(self.get_key(path, width, height, scale))
+        except OSError:
+            return None
+
+    def load_async(
+        self, path: str, width: int, height: int, scale: int, callback: callable
+    ) -> Future:
+        """
+        Decode the image on a worker thread and call ``callback(pixbuf, error)`` on the main loop.
+
+        Cancelling the returned future skips a decode that has not started yet. A decode that
+        is already running still finishes and is cached, so callers that replaced the request
+        should compare the future they got with the one they are waiting for.
+        """
+        future = self.__get_pool().submit(self.load, path, width, height, scale)
+        future.add_done_callback(
+            lambda future: GLib.idle_add(self.__deliver, future, callback)
+        )
+        return future
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __lookup(self, key: tuple) -> GdkPixbuf.Pixbuf:
+        with self._lock:
+            pixbuf = self._entries.get(key, None)
+            if pixbuf is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+            return pixbuf
+
+    def __deliver(self, future: Future, callback: callable) -> bool:
+        if not future.cancelled():
+            error = future.exception()
+            callback(None if error else future.result(), error)
+        return False
+
+    def __get_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=DECODE_POOL_SIZE, thread_name_prefix="lst-pixbuf"
+                )
+            return self._pool
+
+    def __add(self, key: tuple, pixbuf: GdkPixbuf.Pixbuf) -> None:
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size -= old.get_byte_length()
+        self._entries[key] = pixbuf
+        self._size += pixbuf.get_byte_length()
+        self.__evict()
+
+    def __evict(self) -> None:
+        # the most recent entry is kept even if it alone exceeds the budget
+        while self._size > self._max_bytes and len(self._entries) > 1:
+            _, pixbuf = self._entries.popitem(last=False)
+            self._size -= pixbuf.get_byte_length()
+
+
+pixbuf_cache = PixbufCache()
@@ -0,0 +1,113 @@
+import builtins
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+
+class StartupProfiler:
+    """
+    Collects timed spans during startup.
+
+    Disabled by default; ``span`` then returns a no-op context manager.
+    When enabled (``lst --profile-startup``) the spans are printed as a report sorted by
+    duration and written as a Chrome trace event file (``chrome://tracing``, Perfetto).
+    """
+
+    def __init__(self):
+        self._enabled = False
+        self._finished = False
+        self._trace_path = None
+        self._epoch = time.perf_counter_ns()
+        self._events = []
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def start(self, trace_path: str) -> None:
+        self._enabled = True
+        self._trace_path = trace_path
+
+    def span(self, name: str, category: str = "startup"):
+        if not self._enabled or self._finished:
+            return nullcontext()
+        return self.__span(name, category)
+
+    @contextmanager
+    def __span(self, name: str, category: str):
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.__add(name, category, start, time.perf_counter_ns() - start)
+
+    def mark(self, name: str, category: str = "startup") -> None:
+        if self._enabled and not self._finished:
+            self.__add(name, category, time.perf_counter_ns(), 0)
+
+    def __add(self, name: str, category: str, start: int, duration: int) -> None:
+        with self._lock:
+            self._events.append(
+                {
+                    "name": name,
+                    "cat": category,
+                    "ph": "X" if duration else "i",
+                    "ts": (start - self._epoch) / 1000,
+                    "dur": duration / 1000,
+                    "pid": os.getpid(),
+                    "tid": threading.get_ident(),
+                }
+            )
+
+    @contextmanager
+    def imports(self):
+        """
+        Time every module imported (for the first time) inside the ``with`` block.
+        """
+        if not self._enabled or self._finished:
+            yield
+            return
+
+        original_import = builtins.__import__
+
+        def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            if level or name in sys.modules:
+                return original_import(name, globals, locals, fromlist, level)
+            with self.span(f"import {name}", "import"):
+                return original_import(name, globals, locals, fromlist, level)
+
+        builtins.__import__ = timed_import
+        try:
+            yield
+        finally:
+            builtins.__import__ = original_import
+
+    def report(self) -> str:
+        lines = [f"{'ms':>10}  {'category':<10}  name"]
+        for event in sorted(self._events, key=lambda e: e["dur"], reverse=True):
+            if event["ph"] == "X":
+                lines.append(f"{event['dur'] / 1000:>10.2f}  {event['cat']:<10}  {event['name']}")
+        for event in sorted(self._events, key=lambda e: e["ts"]):
+            if event["ph"] == "i":
+                lines.append(f"{'@' + format(event['ts'] / 1000, '.2f'):>10}  {event['cat']:<10}  {event['name']}")
+        return "\n".join(lines)
+
+    def finish(self) -> bool:
+        if not self._enabled or self._finished:
+            return False
+        self._finished = True
+
+        print(self.report())
+
+        os.makedirs(os.path.dirname(self._trace_path) or ".", exist_ok=True)
+        with open(self._trace_path, "w") as file:
+            json.dump({"traceEvents": self._events, "displayTimeUnit": "ms"}, file)
+        print(f"Startup trace written to {self._trace_path}")
+        return False
+
+
+profiler = StartupProfiler()
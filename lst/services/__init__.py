@@ -0,0 +1 @@
+from lst.base_service import LazyService, preload
@@ -2,7 +2,7 @@ import os
 import subprocess
 from gi.repository import GObject, Gio, GLib
 from lst.utils import read_json, write_json
-from lst.base_service import BaseService
+from lst.base_service import BaseService, LazyService
 from typing import List
 
 APPLICATIONS_CACHE_FILE = f"{GLib.get_user_cache_dir()}/lst/apps.json"
@@ -150,4 +150,4 @@ class ApplicationsService(BaseService):
         }
 
 
-applications = ApplicationsService()
+applications = LazyService(ApplicationsService)
@@ -1,14 +1,16 @@
 import threading
 import pulsectl
 from gi.repository import GObject
-from lst.base_service import BaseService
+from lst.base_service import BaseService, LazyService
 from typing import List
 
-PULSE = pulsectl.Pulse("lst-audio-service", threading_lock=True)
-PULSE_MONITOR = pulsectl.Pulse("lst-audio-service-monitor", threading_lock=True)
+PULSE = None
+PULSE_MONITOR = None
 
 
 class Device(BaseService):
+    notify_changes_only = True
+
     def __init__(self, device):
         super().__init__()
         self._device = device
@@ -135,6 +137,10 @@ class AudioService(BaseService):
     }
 
     def __init__(self):
+        global PULSE, PULSE_MONITOR
+        PULSE = pulsectl.Pulse("lst-audio-service", threading_lock=True)
+        PULSE_MONITOR = pulsectl.Pulse("lst-audio-service-monitor", threading_lock=True)
+
         super().__init__()
         self._sinks = []
         self._sources = []
@@ -204,4 +210,4 @@ class AudioService(BaseService):
             self._sources.append(obj)
 
 
-audio = AudioService()
+audio = LazyService(AudioService)
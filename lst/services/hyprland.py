@@ -1,12 +1,46 @@
 import json
 import os
-import threading
 import socket
-from gi.repository import GObject
-from lst.base_service import BaseService
-from typing import List
+import traceback
+from gi.repository import GObject, GLib
+from lst.base_service import BaseService, LazyService
+from typing import Dict, List
 
 HYPRLAND_INSTANCE_SIGNATURE = os.getenv("HYPRLAND_INSTANCE_SIGNATURE")
+READ_SIZE = 65536
+
+
+class EventReader:
+    """
+    Splits the Hyprland event stream (``EVENT>>DATA`` lines) into events and calls
+    ``handlers[EVENT](DATA)`` for every complete line.
+
+    Data may arrive in chunks of any size: an incomplete last line is kept until the rest of it arrives,
+    and lines are only decoded once complete, so multi-byte characters split between chunks are kept intact.
+    Events without a handler are skipped. Exceptions raised by a handler are printed and
+    the remaining events are still dispatched.
+    """
+
+    def __init__(self, handlers: Dict[str, callable]):
+        self._handlers = handlers
+        self._buffer = b""
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    def feed(self, data: bytes) -> None:
+        lines = (self._buffer + data).split(b"\n")
+        self._buffer = lines.pop()
+        for line in lines:
+            name, _, payload = line.partition(b">>")
+            handler = self._handlers.get(name.decode("utf-8", "replace"), None)
+            if handler:
+                # one failing handler must not drop the rest of the stream
+                try:
+                    handler(payload.decode("utf-8", "replace"))
+                except Exception:
+                    traceback.print_exc()
 
 
 class HyprlandService(BaseService):
@@ -21,8 +55,18 @@ class HyprlandService(BaseService):
         self.__sync_workspaces()
         self._kb_layout = "English (US)"
         self._active_window = ""
-
-        threading.Thread(target=self.__monitor_socket, daemon=True).start()
+        self._workspaces_dirty = False
+
+        self.__reader = EventReader(
+            {
+                "workspace": self.__on_workspace_event,
+                "destroyworkspace": self.__on_workspace_event,
+                "focusedmon": self.__on_workspace_event,
+                "activelayout": self.__on_active_layout,
+                "activewindow": self.__on_active_window,
+            }
+        )
+        self.__connect_events()
 
     @GObject.Property
     def workspaces(self) -> List[dict]:
@@ -40,29 +84,61 @@ class HyprlandService(BaseService):
     def active_window(self) -> str:
         return self._active_window
 
-    def __monitor_socket(self) -> None:
-        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
-            sock.connect(f"/tmp/hypr/{HYPRLAND_INSTANCE_SIGNATURE}/.socket2.sock")
-            while True:
-                data = sock.recv(1024).decode("utf-8").split("\n")
-                if data:
-                    for d in data:
-                        if (
-                            d.startswith("workspace>>")
-                            or d.startswith("destroyworkspace>>")
-                            or d.startswith("focusedmon>>")
-                        ):
-                            self.__sync_workspaces()
-                        elif d.startswith("activelayout>>"):
-                            self._kb_layout = d.split(",")[1].replace("\n", "")
-                            self.notify('kb_layout')
-                            self.emit("kb_layout_changed")
-
-                        elif d.startswith("activewindow>>"):
-                            self._active_window = d.replace("activewindow>>", "").split(
-                                ","
-                            )[1]
-                            self.emit("active_window_changed")
+    def __connect_events(self) -> None:
+        self.__socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self.__socket.connect(
+                f"/tmp/hypr/{HYPRLAND_INSTANCE_SIGNATURE}/.socket2.sock"
+            )
+        except OSError as e:
+            print(f"Can't connect to Hyprland event socket: {e}")
+            self.__socket.close()
+            return
+        self.__socket.setblocking(False)
+        GLib.io_add_watch(
+            self.__socket.fileno(),
+            GLib.PRIORITY_DEFAULT,
+            GLib.IOCondition.IN | GLib.IOCondition.HUP | GLib.IOCondition.ERR,
+            self.__on_socket_ready,
+        )
+
+    def __on_socket_ready(self, fd: int, condition: GLib.IOCondition) -> bool:
+        while True:
+            try:
+                data = self.__socket.recv(READ_SIZE)
+            except BlockingIOError:
+                break
+            except OSError as e:
+                print(f"Hyprland event socket error: {e}")
+                data = b""
+
+            if not data:
+                self.__socket.close()
+                return False
+            self.__reader.feed(data)
+
+        # a burst of workspace events needs only one sync
+        if self._workspaces_dirty:
+            self._workspaces_dirty = False
+            # returning False or raising here would remove the watch and stop all events
+            try:
+                self.__sync_workspaces()
+            except Exception:
+                traceback.print_exc()
+        return True
+
+    def __on_workspace_event(self, data: str) -> None:
+        self._workspaces_dirty = True
+
+    def __on_active_layout(self, data: str) -> None:
+        self._kb_layout = data.partition(",")[2]
+        self.notify('kb_layout')
+        self.emit("kb_layout_changed")
+
+    def __on_active_window(self, data: str) -> None:
+        # window titles may contain commas
+        self._active_window = data.partition(",")[2]
+        self.emit("active_window_changed")
 
     def __sync_workspaces(self) -> None:
         self._workspaces = sorted(
@@ -73,12 +149,18 @@ class HyprlandService(BaseService):
         self.notify('workspaces')
         self.notify('active-workspace')
 
-    def send_command(self, cmd: str) -> None:
+    def send_command(self, cmd: str) -> str:
         with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
             sock.connect(f"/tmp/hypr/{HYPRLAND_INSTANCE_SIGNATURE}/.socket.sock")
-            sock.send(cmd.encode())
-            resp = sock.recv(4096).decode()
-            return resp
+            sock.sendall(cmd.encode())
+            # Hyprland closes the connection after the reply, which may be larger than one read
+            chunks = []
+            while True:
+                chunk = sock.recv(READ_SIZE)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            return b"".join(chunks).decode()
 
     def switch_kb_layout(self) -> None:
         for kb in json.loads(self.send_command("j/devices"))["keyboards"]:
@@ -88,4 +170,4 @@ class HyprlandService(BaseService):
         self.send_command(f"dispatch workspace {workspace_id}")
 
 
-hyprland = HyprlandService()
+hyprland = LazyService(HyprlandService)
@@ -4,18 +4,17 @@ import requests
 import threading
 from lst.dbus import DbusClient
 from gi.repository import GObject, GLib
-from lst.base_service import BaseService
+from lst.base_service import BaseService, LazyService
 
 ART_URL_CACHE_DIR = f"{GLib.get_user_cache_dir()}/lst/art_url"
 
-os.makedirs(ART_URL_CACHE_DIR, exist_ok=True)
-
 
 class MprisPlayer(BaseService):
     __gsignals__ = {
         "closed": (GObject.SignalFlags.RUN_FIRST, GObject.TYPE_NONE, ()),
         "changed": (GObject.SignalFlags.RUN_FIRST, GObject.TYPE_NONE, ()),
     }
+    notify_changes_only = True
 
     def __init__(self, name: str):
         super().__init__()
@@ -228,6 +227,7 @@ class MprisService(BaseService):
 
     def __init__(self):
         super().__init__()
+        os.makedirs(ART_URL_CACHE_DIR, exist_ok=True)
         self.__dbus = DbusClient(
             name="org.freedesktop.DBus",
             object_path="/org/freedesktop/DBus",
@@ -271,4 +271,4 @@ class MprisService(BaseService):
         return list(self.__players.values())
 
 
-mpris = MprisService()
+mpris = LazyService(MprisService)
@@ -1,5 +1,5 @@
 from gi.repository import GObject, NM, GLib
-from lst.base_service import BaseService
+from lst.base_service import BaseService, LazyService
 
 STATE = {
     NM.DeviceState.UNKNOWN: "unknown",
@@ -25,14 +25,24 @@ def get_device(client: NM.Client, device_type: NM.DeviceType):
 
 
 class WifiAccessPoint(BaseService):
+    notify_changes_only = True
+
     def __init__(self, point: NM.AccessPoint):
         self._point = point
         super().__init__()
-        self._point.connect(
+        self._strength_id = self._point.connect(
             "notify::strength",
             lambda *args: (self.notify("strength"), self.notify("icon-name")),
         )
 
+    def release(self) -> None:
+        """
+        Stop following the access point, e.g. once it disappeared.
+        """
+        if self._strength_id:
+            self._point.disconnect(self._strength_id)
+            self._strength_id = None
+
     @GObject.Property
     def bandwidth(self) -> int:
         return self._point.props.bandwidth
@@ -129,9 +139,15 @@ class Ethernet(BaseService):
 
 
 class Wifi(BaseService):
+    notify_changes_only = True
+
     def __init__(self, client: NM.Client):
         super().__init__()
         self.__client = client
+        self.__device = None
+        # one wrapper per NM.AccessPoint, so reading access_points neither creates
+        # new wrappers nor counts as a change for notify_changes_only
+        self._access_points = {}
         self.__client.connect(
             "notify::wireless-enabled", lambda *args: self.notify_all()
         )
@@ -143,10 +159,7 @@ class Wifi(BaseService):
 
     @GObject.Property
     def access_points(self) -> list:
-        if self.__device:
-            return [WifiAccessPoint(i) for i in self.__device.get_access_points()]
-        else:
-            return []
+        return list(self._access_points.values())
 
     @GObject.Property
     def ap(self):
@@ -177,19 +190,34 @@ class Wifi(BaseService):
                 None, lambda x, result: self.__device.request_scan_finish(result)
             )
 
+    def __on_access_point_added(self, device: NM.DeviceWifi, point: NM.AccessPoint) -> None:
+        if point not in self._access_points:
+            self._access_points[point] = WifiAccessPoint(point)
+            self.notify("access_points")
+
+    def __on_access_point_removed(self, device: NM.DeviceWifi, point: NM.AccessPoint) -> None:
+        access_point = self._access_points.pop(point, None)
+        if access_point:
+            access_point.release()
+            self.notify("access_points")
+
     def update(self) -> None:
-        self.__device = get_device(client=self.__client, device_type=NM.DeviceType.WIFI)
+        device = get_device(client=self.__client, device_type=NM.DeviceType.WIFI)
+        if device is not self.__device:
+            for access_point in self._access_points.values():
+                access_point.release()
+            self._access_points = {}
+            self.__device = device
+            if device:
+                for point in device.get_access_points():
+                    self._access_points[point] = WifiAccessPoint(point)
+                device.connect("access-point-added", self.__on_access_point_added)
+                device.connect("access-point-removed", self.__on_access_point_removed)
+                device.connect(
+                    "notify::active-access-point",
+                    lambda *args: self.__update_ap(),
+                )
         if self.__device:
-            self.__device.connect(
-                "access-point-added", lambda *args: self.notify("access_points")
-            )
-            self.__device.connect(
-                "access-point-removed", lambda *args: self.notify("access_points")
-            )
-            self.__device.connect(
-                "notify::active-access-point",
-                lambda *args: self.__update_ap(),
-            )
             self.__update_ap()
         self.notify_all()
 
@@ -213,4 +241,4 @@ class NetworkService(BaseService):
         self._wifi.update()
 
 
-network = NetworkService()
+network = LazyService(NetworkService)
@@ -1,18 +1,16 @@
 import datetime
 import os
-from lst.dbus import DbusService
+from collections import OrderedDict
+from lst.dbus import DbusService, get_worker_pool
 from gi.repository import GLib, GObject, GdkPixbuf
 from lst.utils import load_interface_xml, read_json, write_json
-from lst.base_service import BaseService
+from lst.base_service import BaseService, LazyService
 
 NOTIFICATIONS_CACHE_DIR = f"{GLib.get_user_cache_dir()}/lst/notifications"
 NOTIFICATIONS_CACHE_FILE = f"{NOTIFICATIONS_CACHE_DIR}/notifications.json"
 NOTIFICATIONS_IMAGE_DATA = f"{NOTIFICATIONS_CACHE_DIR}/images"
 NOTIFICATIONS_EMPTY_CACHE_FILE = {"notifications": [], "dnd": False}
 
-os.makedirs(NOTIFICATIONS_CACHE_DIR, exist_ok=True)
-os.makedirs(NOTIFICATIONS_IMAGE_DATA, exist_ok=True)
-
 class Notification(BaseService):
     __gsignals__ = {
         "closed": (GObject.SignalFlags.RUN_FIRST, GObject.TYPE_NONE, ()),
@@ -138,6 +136,8 @@ class NotificationService(BaseService):
 
     def __init__(self):
         super().__init__()
+        os.makedirs(NOTIFICATIONS_CACHE_DIR, exist_ok=True)
+        os.makedirs(NOTIFICATIONS_IMAGE_DATA, exist_ok=True)
 
         self.__dbus = DbusService(
             name="org.freedesktop.Notifications",
@@ -149,27 +149,36 @@ class NotificationService(BaseService):
         )
 
         self.__dbus.register_dbus_method(
-            name="GetServerInformation", method=self.GetServerInformation
+            name="GetServerInformation",
+            method=self.GetServerInformation,
+            dispatch="inline",
+        )
+        self.__dbus.register_dbus_method(
+            name="GetCapabilities", method=self.GetCapabilities, dispatch="inline"
         )
         self.__dbus.register_dbus_method(
-            name="GetCapabilities", method=self.GetCapabilities
+            name="CloseNotification", method=self.CloseNotification, dispatch="main"
         )
         self.__dbus.register_dbus_method(
-            name="CloseNotification", method=self.CloseNotification
+            name="Notify", method=self.Notify, dispatch="main", max_pending=256
         )
-        self.__dbus.register_dbus_method(name="Notify", method=self.Notify)
 
         self._id = 1
         self._notifications = {}
         self._popups = {}
         self._dnd = False
+        self._sync_id = None
+        # id -> [notification, ready], published in order once ready
+        self._pending = OrderedDict()
 
         self.__load_notifications()
 
     @GObject.Property
     def notifications(self) -> list:
         return sorted(
-            list(self._notifications.values()), key=lambda x: x.id, reverse=True
+            [n for n in self._notifications.values() if n.id not in self._pending],
+            key=lambda x: x.id,
+            reverse=True,
         )
 
     @GObject.Property
@@ -183,7 +192,7 @@ class NotificationService(BaseService):
     @dnd.setter
     def dnd(self, value: bool) -> None:
         self._dnd = value
-        self.__sync()
+        self.__queue_sync()
         self.emit("toggled_dnd", self._dnd)
 
     def toggle_dnd(self) -> None:
@@ -237,9 +246,9 @@ class NotificationService(BaseService):
         if isinstance(app_icon, str):
             icon = app_icon
 
-        if "image-data" in hints:
+        image_data = hints.get("image-data", None)
+        if image_data:
             icon = f"{NOTIFICATIONS_IMAGE_DATA}/{id}"
-            self.__save_pixbuf(hints["image-data"], icon)
 
         notification = Notification(
             id=id,
@@ -254,6 +263,39 @@ class NotificationService(BaseService):
             popup=not self._dnd,
         )
 
+        # registered right away so CloseNotification can find it, announced in id order once ready
+        self.__add_notification(notification)
+        self._pending[id] = [notification, not image_data]
+
+        if image_data:
+            # PNG encoding runs on the worker pool, the notification is shown once the file exists
+            future = get_worker_pool().submit(self.__save_pixbuf, image_data, icon)
+            future.add_done_callback(
+                lambda future: GLib.idle_add(self.__on_image_saved, future, notification)
+            )
+        else:
+            self.__publish_pending()
+
+        return GLib.Variant("(u)", (id,))
+
+    def __on_image_saved(self, future, notification: Notification) -> bool:
+        if future.exception():
+            print(f"Failed to save notification image: {future.exception()}")
+        entry = self._pending.get(notification.id, None)
+        if entry and entry[0] is notification:
+            entry[1] = True
+            self.__publish_pending()
+        return False
+
+    def __publish_pending(self) -> None:
+        while self._pending:
+            id, (notification, ready) = next(iter(self._pending.items()))
+            if not ready:
+                break
+            self._pending.pop(id)
+            self.__publish_notification(notification)
+
+    def __publish_notification(self, notification: Notification) -> None:
         if len(self.popups) > 3:
             self.popups[-1].dismiss()
 
@@ -262,13 +304,10 @@ class NotificationService(BaseService):
             self.emit("new_popup", notification)
             self.notify('popups')
 
-        self.__add_notification(notification)
-        self.__sync()
+        self.__queue_sync()
         self.emit("notified", notification)
         self.notify('notifications')
 
-        return GLib.Variant("(u)", (id,))
-
     def __save_pixbuf(self, px_args, save_path: str) -> None:
         GdkPixbuf.Pixbuf.new_from_bytes(
             width=px_args[0],
@@ -285,10 +324,21 @@ class NotificationService(BaseService):
             notify.close()
 
     def __close_notification(self, notification: Notification) -> None:
+        entry = self._pending.get(notification.id, None)
+        if entry and entry[0] is notification:
+            # closed before it was announced: drop it without ever showing it
+            self._pending.pop(notification.id)
+            self._notifications.pop(notification.id, None)
+            self.__dbus.emit_signal(
+                "NotificationClosed", GLib.Variant("(uu)", (notification.id, 2))
+            )
+            self.__publish_pending()
+            return
+
         self._notifications.pop(notification.id)
         if notification.popup:
             notification.dismiss()
-        self.__sync()
+        self.__queue_sync()
 
         self.__dbus.emit_signal(
             "NotificationClosed", GLib.Variant("(uu)", (notification.id, 2))
@@ -308,13 +358,20 @@ class NotificationService(BaseService):
             "ActionInvoked", GLib.Variant("(us)", (notification.id, action))
         )
 
-    def __sync(self) -> None:
+    def __queue_sync(self) -> None:
+        # a burst of notifications rewrites the history file only once
+        if not self._sync_id:
+            self._sync_id = GLib.idle_add(self.__sync, priority=GLib.PRIORITY_LOW)
+
+    def __sync(self) -> bool:
+        self._sync_id = None
         data = {
             "id": self._id,
             "notifications": [n.json for n in self.notifications],
             "dnd": self._dnd,
         }
         write_json(NOTIFICATIONS_CACHE_FILE, data)
+        return False
 
     def __add_notification(self, notification: Notification) -> None:
         notification.connect("closed", lambda x: self.__close_notification(x))
@@ -340,4 +397,4 @@ class NotificationService(BaseService):
             write_json(NOTIFICATIONS_CACHE_FILE, NOTIFICATIONS_EMPTY_CACHE_FILE)
 
 
-notifications = NotificationService()
+notifications = LazyService(NotificationService)
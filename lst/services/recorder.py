@@ -1,5 +1,5 @@
 from gi.repository import GObject, Gst, GLib
-from lst.base_service import BaseService
+from lst.base_service import BaseService, LazyService
 from lst.dbus import DbusClient
 from lst.app import app
 import datetime
@@ -184,4 +184,4 @@ class RecorderService(BaseService):
             self.emit("recording_stopped")
 
 
-recorder = RecorderService()
+recorder = LazyService(RecorderService)
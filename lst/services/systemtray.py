@@ -2,7 +2,7 @@ from lst.utils import load_interface_xml
 from lst.dbus import DbusService, DbusClient
 from gi.repository import Gio, GLib, GObject, DbusmenuGtk3, GdkPixbuf
 from typing import Union
-from lst.base_service import BaseService
+from lst.base_service import BaseService, LazyService
 
 
 class SystemTrayItem(BaseService):
@@ -216,4 +216,4 @@ class SystemTrayService(BaseService):
         self.notify('items')
 
 
-system_tray = SystemTrayService()
+system_tray = LazyService(SystemTrayService)
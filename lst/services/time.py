@@ -1,6 +1,6 @@
 from gi.repository import GObject, GLib
 from datetime import datetime
-from lst.base_service import BaseService
+from lst.base_service import BaseService, LazyService
 
 
 class TimeService(BaseService):
@@ -22,4 +22,4 @@ class TimeService(BaseService):
         return self._time
 
 
-time = TimeService()
+time = LazyService(TimeService)
@@ -0,0 +1,147 @@
+import hashlib
+import sass
+from collections import OrderedDict
+from gi.repository import Gtk, Gdk, GLib
+
+
+class StyleEntry:
+    def __init__(self, provider: Gtk.CssProvider):
+        self.provider = provider
+        self.refs = 0
+
+
+class StyleCache:
+    """
+    Process-wide cache of compiled inline widget styles.
+
+    Widgets with the same ``style`` string share one compiled ``Gtk.CssProvider``.
+    Entries are reference counted. An entry nobody uses any more moves to a small
+    least-recently-used list of at most ``max_unused`` entries, so a style that is
+    set again soon (e.g. toggled on hover) is not compiled again, and is dropped from there.
+    """
+
+    def __init__(self, max_unused: int = 32):
+        self._max_unused = max_unused
+        self._entries = {}
+        self._unused = OrderedDict()
+        self._compiles = 0
+
+    @property
+    def max_unused(self) -> int:
+        return self._max_unused
+
+    @max_unused.setter
+    def max_unused(self, value: int) -> None:
+        self._max_unused = value
+        self.__evict()
+
+    @property
+    def compiles(self) -> int:
+        return self._compiles
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._unused)
+
+    def compile(self, style: str) -> str:
+        self._compiles += 1
+        return sass.compile(string="* {" + style + "}")
+
+    def acquire(self, style: str) -> Gtk.CssProvider:
+        entry = self._entries.get(style, None)
+        if not entry:
+            entry = self._unused.pop(style, None)
+            if not entry:
+                provider = Gtk.CssProvider()
+                provider.load_from_data(self.compile(style).encode())
+                entry = StyleEntry(provider)
+            self._entries[style] = entry
+
+        entry.refs += 1
+        return entry.provider
+
+    def release(self, style: str) -> None:
+        entry = self._entries.get(style, None)
+        if entry:
+            entry.refs -= 1
+            if entry.refs <= 0:
+                entry.refs = 0
+                del self._entries[style]
+                self._unused[style] = entry
+                self.__evict()
+
+    def clear(self) -> None:
+        self._unused.clear()
+
+    def __evict(self) -> None:
+        while len(self._unused) > self._max_unused:
+            self._unused.popitem(last=False)
+
+
+class StyleSheet:
+    """
+    A single screen-wide stylesheet that holds the inline styles of all widgets.
+
+    When enabled, every distinct ``style`` string becomes a rule for a generated
+    class selector (``.lst-style-<hash>``) and widgets just get that class added.
+    Rules are reference counted and the provider is regenerated at most once per main loop iteration.
+    """
+
+    PREFIX = "lst-style-"
+
+    def __init__(self):
+        self._enabled = False
+        self._rules = OrderedDict()
+        self._provider = None
+        self._flush_id = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self._enabled = value
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def acquire(self, style: str) -> str:
+        rule = self._rules.get(style, None)
+        if not rule:
+            class_name = self.PREFIX + hashlib.sha1(style.encode()).hexdigest()[:12]
+            css = sass.compile(string="." + class_name + " {" + style + "}")
+            rule = self._rules[style] = [class_name, css, 0]
+            self.__schedule_flush()
+
+        rule[2] += 1
+        return rule[0]
+
+    def release(self, style: str) -> None:
+        rule = self._rules.get(style, None)
+        if rule:
+            rule[2] -= 1
+            if rule[2] <= 0:
+                self._rules.pop(style)
+                self.__schedule_flush()
+
+    def __schedule_flush(self) -> None:
+        if not self._flush_id:
+            self._flush_id = GLib.idle_add(self.__flush, priority=GLib.PRIORITY_HIGH_IDLE)
+
+    def __flush(self) -> bool:
+        self._flush_id = None
+        if not self._provider:
+            self._provider = Gtk.CssProvider()
+            Gtk.StyleContext.add_provider_for_screen(
+                Gdk.Screen.get_default(),
+                self._provider,
+                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION + 1,
+            )
+        self._provider.load_from_data(
+            "\n".join(rule[1] for rule in self._rules.values()).encode()
+        )
+        return False
+
+
+style_cache = StyleCache()
+style_sheet = StyleSheet()
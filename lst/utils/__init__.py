@@ -5,4 +5,5 @@ from lst.utils.load_interface_xml import load_interface_xml
 from lst.utils.poll import Poll
 from lst.utils.format_seconds import format_seconds
 from lst.utils.get_monitor_geometry import get_monitor_geometry
-from lst.utils.get_n_monitors import get_n_monitors
\ No newline at end of file
+from lst.utils.get_n_monitors import get_n_monitors
+from lst.utils.compile_scss import compile_scss
@@ -0,0 +1,87 @@
+import hashlib
+import os
+import re
+import sass
+from gi.repository import GLib
+from typing import List
+
+SCSS_CACHE_DIR = f"{GLib.get_user_cache_dir()}/lst/scss"
+
+IMPORT_RE = re.compile(r"@(?:import|use|forward)\s+([^;]+);")
+QUOTED_RE = re.compile(r"[\"']([^\"']+)[\"']")
+
+
+def _resolve_import(name: str, directory: str) -> str:
+    if name.startswith(("sass:", "http://", "https://", "//", "url(")):
+        return None
+
+    path = os.path.join(directory, name)
+    head, tail = os.path.split(path)
+    candidates = []
+    for ext in ("", ".scss", ".sass", ".css"):
+        candidates.append(path + ext)
+        candidates.append(os.path.join(head, "_" + tail + ext))
+    for index in ("_index.scss", "index.scss", "_index.sass", "index.sass"):
+        candidates.append(os.path.join(path, index))
+
+    for candidate in candidates:
+        if os.path.isfile(candidate):
+            return os.path.realpath(candidate)
+    return None
+
+
+def _collect_sources(path: str) -> List[str]:
+    sources = []
+    stack = [os.path.realpath(path)]
+    while stack:
+        current = stack.pop()
+        if current in sources:
+            continue
+        sources.append(current)
+        with open(current, "r") as file:
+            content = file.read()
+        directory = os.path.dirname(current)
+        for statement in IMPORT_RE.findall(content):
+            for name in QUOTED_RE.findall(statement):
+                resolved = _resolve_import(name, directory)
+                if resolved:
+                    stack.append(resolved)
+    return sorted(sources)
+
+
+def compile_scss(path: str) -> str:
+    """
+    Compile the SCSS file at ``path``, reusing the on-disk cache when neither
+    the file nor any partial it imports has changed since the last compile.
+    """
+    entry = os.path.realpath(path)
+    entry_key = hashlib.sha256(entry.encode()).hexdigest()[:16]
+
+    digest = hashlib.sha256(sass.__version__.encode())
+    for source in _collect_sources(entry):
+        digest.update(source.encode())
+        with open(source, "rb") as file:
+            digest.update(file.read())
+
+    cache_file = f"{SCSS_CACHE_DIR}/{entry_key}-{digest.hexdigest()}.css"
+    try:
+        with open(cache_file, "r") as file:
+            return file.read()
+    except OSError:
+        pass
+
+    compiled = sass.compile(filename=path)
+
+    try:
+        os.makedirs(SCSS_CACHE_DIR, exist_ok=True)
+        for name in os.listdir(SCSS_CACHE_DIR):
+            if name.startswith(entry_key + "-"):
+                os.remove(os.path.join(SCSS_CACHE_DIR, name))
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "w") as file:
+            file.write(compiled)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+    return compiled
@@ -1,4 +1,5 @@
 from lst.base_service import BaseService
+from lst.config_scope import config_scope
 from gi.repository import GLib, GObject
 
 
@@ -12,14 +13,31 @@ class Poll(BaseService):
         self._timeout = timeout
         self._callback = callback
         self._args = args
+        self._source_id = None
+        self._cancelled = False
+        config_scope.add_poll(self, callback)
         self.__main()
 
     @GObject.Property
     def output(self) -> str:
         return self._output
 
-    def __main(self) -> None:        
+    def cancel(self) -> None:
+        """
+        Stop polling. The last output is kept.
+        """
+        self._cancelled = True
+        if self._source_id:
+            GLib.source_remove(self._source_id)
+            self._source_id = None
+
+    def __main(self) -> bool:
+        self._source_id = None
+        if self._cancelled:
+            return False
         self._output = self._callback(*self._args)
         self.emit("changed")
         self.notify('output')
-        GLib.timeout_add_seconds(self._timeout, self.__main)
+        if not self._cancelled:
+            self._source_id = GLib.timeout_add_seconds(self._timeout, self.__main)
+        return False
@@ -20,6 +20,7 @@ from lst.widgets.grid import Grid
 from lst.widgets.menu import Menu
 from lst.widgets.menuitem import MenuItem
 from lst.widgets.popup_window import PopupWindow
+from lst.widgets.virtual_list import VirtualList
 
 class Widget:
     Window = Window
@@ -44,3 +45,4 @@ class Widget:
     Menu = Menu
     MenuItem = MenuItem
     PopupWindow = PopupWindow
+    VirtualList = VirtualList
@@ -1,5 +1,7 @@
 from gi.repository import Gtk, GObject
 from lst.base_widget import BaseWidget
+from lst.widgets.keyed_children import KeyedChildren
+from lst.widgets.child_list import ChildList
 from typing import List, Any
 
 ORIENTATION = {
@@ -7,7 +9,7 @@ ORIENTATION = {
     "v": Gtk.Orientation.VERTICAL,
 }
 
-class Box(Gtk.Box, BaseWidget):
+class Box(ChildList, Gtk.Box, BaseWidget):
     """
     Bases: `Gtk.Box <https://lazka.github.io/pgi-docs/#Gtk-3.0/classes/Box.html>`_, :class:`~lst.base_widget.BaseWidget`.
 
@@ -23,8 +25,11 @@ class Box(Gtk.Box, BaseWidget):
             )
 
     Parameters:
-        child (``List[Gtk.Widget]``, optional): The list of child widgets.
+        child (``List[Gtk.Widget]``, optional): The list of child widgets. If ``child_factory`` is passed, the list of items to build rows from.
         orientation (``str``, optional): Orientation of the widget. Possible values: ``"h"``, ``"v"``.
+        child_factory (``callable``, optional): Enables keyed mode. Function that builds a widget from an item.
+        child_key (``callable``, optional): Function that returns a unique key for an item. The item itself is used by default.
+        child_update (``callable``, optional): Function ``(widget, item)`` called when the item of an existing row changes.
 
     .. code-block:: python
     
@@ -34,18 +39,60 @@ class Box(Gtk.Box, BaseWidget):
             homogeneous=False,
             spacing=52
         )
+
+    In keyed mode only rows whose keys were added or removed are built or destroyed, and
+    existing rows are reordered instead of being rebuilt:
+
+    .. code-block:: python
+
+        Widget.Box(
+            child=hyprland.bind("workspaces"),
+            child_key=lambda workspace: workspace["id"],
+            child_factory=lambda workspace: Widget.Button(
+                child=Widget.Label(label=str(workspace["id"])),
+                on_click=lambda x: hyprland.switch_to_workspace(workspace["id"]),
+            ),
+        )
+
+    Single children can be added, removed and moved without touching the others with
+    ``append``, ``prepend``, ``insert``, ``remove_child`` and ``move_child``, and the box can be fed
+    directly from service signals with ``bind_children`` (see :class:`~lst.widgets.child_list.ChildList`).
+    Every change emits ``children_changed(position, removed, added)``.
+    ``notifications.notifications`` is sorted newest first, so the column keeps that order and new
+    notifications are prepended:
+
+    .. code-block:: python
+
+        column = Widget.Box(orientation="v")
+        column.bind_children(
+            notifications,
+            "notified",
+            "closed",
+            factory=lambda notification: Widget.Label(label=notification.summary),
+            items=notifications.notifications,
+            prepend=True,
+        )
     """
 
 
     __gproperties__ = {**BaseWidget.gproperties}
+    __gsignals__ = {**ChildList.gsignals}
 
     def __init__(
         self,
         child: List[Gtk.Widget] = None,
         orientation: str = "h",
+        child_factory: callable = None,
+        child_key: callable = None,
+        child_update: callable = None,
         **kwargs
     ):
         Gtk.Box.__init__(self)
+        self._keyed = (
+            KeyedChildren(child_factory, child_key, child_update)
+            if child_factory
+            else None
+        )
         BaseWidget.__init__(self, **kwargs)
 
         self.child = child
@@ -57,12 +104,32 @@ class Box(Gtk.Box, BaseWidget):
 
     @child.setter
     def child(self, child: list) -> None:
-        for c in self.get_children():
-            self.remove(c)
-        if child:
-            for c in child:
-                if c:
-                    self.add(c)
+        removed = len(self.get_children())
+        if self._keyed:
+            self._keyed.reconcile(
+                child,
+                insert=self._insert_child,
+                remove=self.remove,
+                move=self.reorder_child,
+            )
+        else:
+            for c in self.get_children():
+                self.remove(c)
+            if child:
+                for c in child:
+                    if c:
+                        self.add(c)
+        self.emit("children_changed", 0, removed, len(self.get_children()))
+
+    def _insert_child(self, widget: Gtk.Widget, position: int) -> None:
+        self.add(widget)
+        self.reorder_child(widget, position)
+
+    def _remove_child(self, widget: Gtk.Widget, position: int) -> None:
+        self.remove(widget)
+
+    def _move_child(self, widget: Gtk.Widget, position: int) -> None:
+        self.reorder_child(widget, position)
 
     def set_property(self, property_name: str, value: Any) -> None:
         if property_name == "orientation":
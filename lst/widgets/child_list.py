@@ -0,0 +1,175 @@
+import weakref
+from gi.repository import Gtk, GObject
+from typing import Any, List
+
+
+class ChildList:
+    """
+    Incremental child operations shared by :class:`~lst.widgets.Widget.Box`,
+    :class:`~lst.widgets.Widget.Grid` and :class:`~lst.widgets.Widget.Menu`.
+
+    Every operation only touches the affected child, notifies ``child`` and emits
+    ``children_changed(position, removed, added)`` (the same arguments as ``Gio.ListModel::items-changed``).
+    Replacing the whole ``child`` list emits ``children_changed(0, old_count, new_count)``.
+
+    Containers implement ``_insert_child(widget, position)``, ``_remove_child(widget, position)``
+    and ``_move_child(widget, position)``, and override ``_ordered_children`` if ``get_children``
+    does not return the children in display order.
+
+    Containers in keyed mode (built with ``child_factory``) raise ``RuntimeError`` from these operations:
+    their rows are owned by the reconciler and only change when ``child`` is set.
+    """
+
+    gsignals = {
+        "children_changed": (
+            GObject.SignalFlags.RUN_FIRST,
+            GObject.TYPE_NONE,
+            (int, int, int),
+        ),
+    }
+
+    def append(self, widget: Gtk.Widget) -> None:
+        """
+        Add ``widget`` after the last child.
+        """
+        self.insert(widget, -1)
+
+    def prepend(self, widget: Gtk.Widget) -> None:
+        """
+        Add ``widget`` before the first child.
+        """
+        self.insert(widget, 0)
+
+    def insert(self, widget: Gtk.Widget, position: int) -> None:
+        """
+        Add ``widget`` at ``position``. A negative or too large position appends it.
+        """
+        self.__check_not_keyed()
+        count = len(self.get_children())
+        if position < 0 or position > count:
+            position = count
+        self._insert_child(widget, position)
+        self._children_changed(position, 0, 1)
+
+    def remove_child(self, widget: Gtk.Widget, destroy: bool = False) -> None:
+        """
+        Remove ``widget`` from the container, and destroy it if ``destroy`` is ``True``.
+        """
+        self.__check_not_keyed()
+        children = self._ordered_children()
+        if widget not in children:
+            print(f"{widget} is not a child of {self}")
+            return
+        position = children.index(widget)
+        self._remove_child(widget, position)
+        if destroy:
+            widget.destroy()
+        self._children_changed(position, 1, 0)
+
+    def move_child(self, widget: Gtk.Widget, position: int) -> None:
+        """
+        Move the existing child ``widget`` to ``position``. A negative position moves it to the end.
+        """
+        self.__check_not_keyed()
+        children = self._ordered_children()
+        if widget not in children:
+            print(f"{widget} is not a child of {self}")
+            return
+        old_position = children.index(widget)
+        if position < 0 or position >= len(children):
+            position = len(children) - 1
+        if position == old_position:
+            return
+        self._move_child(widget, position)
+        span = abs(position - old_position) + 1
+        self._children_changed(min(position, old_position), span, span)
+
+    def bind_children(
+        self,
+        source: GObject.Object,
+        added_signal: str,
+        removed_signal: str,
+        factory: callable,
+        key: callable = None,
+        items: List[Any] = None,
+        prepend: bool = False,
+    ) -> None:
+        """
+        Feed the container from ``source`` signals that carry a single item.
+
+        ``factory(item)`` builds a child when ``added_signal`` is emitted, and the child
+        built for the same ``key(item)`` (the item itself by default) is removed and destroyed
+        when ``removed_signal`` is emitted. ``items`` are the entries that already exist, in display
+        order (first item first); they are always added in that order. Children for new items are
+        appended, or prepended if ``prepend`` is ``True``. For a newest-first column such as
+        ``notifications.notifications`` pass ``prepend=True``.
+
+        Like widget bindings, only a weak reference to the container is kept: the handlers are
+        disconnected when it is destroyed or garbage collected.
+
+        .. code-block:: python
+
+            column = Widget.Box(orientation="v")
+            column.bind_children(
+                notifications,
+                "notified",
+                "closed",
+                factory=lambda notification: Widget.Label(label=notification.summary),
+                items=notifications.notifications,
+                prepend=True,
+            )
+        """
+        container_ref = weakref.ref(self)
+        widgets = {}
+        handler_ids = []
+
+        def disconnect() -> None:
+            for handler_id in handler_ids:
+                source.disconnect(handler_id)
+            handler_ids.clear()
+            widgets.clear()
+
+        def add(item: Any, at_start: bool) -> None:
+            container = container_ref()
+            if container is None:
+                disconnect()
+                return
+            widget = factory(item)
+            widgets[key(item) if key else item] = widget
+            if at_start:
+                container.prepend(widget)
+            else:
+                container.append(widget)
+
+        def on_added(source: GObject.Object, item: Any) -> None:
+            add(item, prepend)
+
+        def on_removed(source: GObject.Object, item: Any) -> None:
+            container = container_ref()
+            if container is None:
+                disconnect()
+                return
+            widget = widgets.pop(key(item) if key else item, None)
+            if widget is not None:
+                container.remove_child(widget, destroy=True)
+
+        for item in items or []:
+            add(item, False)
+
+        handler_ids.append(source.connect(added_signal, on_added))
+        handler_ids.append(source.connect(removed_signal, on_removed))
+        self.connect("destroy", lambda *args: disconnect())
+
+    def __check_not_keyed(self) -> None:
+        # the keyed reconciler tracks the order of its rows, so they must only change through ``child``
+        if self._keyed:
+            raise RuntimeError(
+                f"{type(self).__name__} with child_factory can only be changed by setting child"
+            )
+
+    def _ordered_children(self) -> List[Gtk.Widget]:
+        return self.get_children()
+
+    def _children_changed(self, position: int, removed: int, added: int) -> None:
+        self.notify("child")
+        self.emit("children_changed", position, removed, added)
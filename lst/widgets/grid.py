@@ -1,17 +1,25 @@
 from gi.repository import Gtk, GObject
 from lst.base_widget import BaseWidget
+from lst.widgets.keyed_children import KeyedChildren
+from lst.widgets.child_list import ChildList
 from typing import List
 
-class Grid(Gtk.Grid, BaseWidget):
+class Grid(ChildList, Gtk.Grid, BaseWidget):
     """
     Bases: `Gtk.Grid <https://lazka.github.io/pgi-docs/#Gtk-3.0/classes/Grid.html>`_, :class:`~lst.base_widget.BaseWidget`.
     
     A container which arranges its child widgets in rows and columns.
 
     Parameters:
-        child(``List[Gtk.Widget]``, optional): The list of child widgets.
+        child(``List[Gtk.Widget]``, optional): The list of child widgets. If ``child_factory`` is passed, the list of items to build cells from.
         column_num(``int``, optional): Number of columns.
         row_num(``int``, optional): Number of rows. Will not have effect if ``column_num`` is passed.
+        child_factory (``callable``, optional): Enables keyed mode, see :class:`~lst.widgets.Widget.Box`.
+        child_key (``callable``, optional): Function that returns a unique key for an item.
+        child_update (``callable``, optional): Function ``(widget, item)`` called when the item of an existing cell changes.
+
+    ``append``, ``prepend``, ``insert``, ``remove_child`` and ``move_child`` only shift the cells after
+    the changed position, see :class:`~lst.widgets.child_list.ChildList`.
     
     .. code-block:: python
 
@@ -29,15 +37,24 @@ class Grid(Gtk.Grid, BaseWidget):
 
     """
     __gproperties__ = {**BaseWidget.gproperties}
+    __gsignals__ = {**ChildList.gsignals}
 
     def __init__(
         self,
         child: List[Gtk.Widget] = None,
         column_num: int = None,
         row_num: int = None,
+        child_factory: callable = None,
+        child_key: callable = None,
+        child_update: callable = None,
         **kwargs
     ):
         Gtk.Grid.__init__(self)
+        self._keyed = (
+            KeyedChildren(child_factory, child_key, child_update)
+            if child_factory
+            else None
+        )
         BaseWidget.__init__(self, **kwargs)
         self._column_num = None
         self._row_num = None
@@ -68,16 +85,81 @@ class Grid(Gtk.Grid, BaseWidget):
 
     @child.setter
     def child(self, child: list) -> None:
-        for c in self.get_children():
-            self.remove(c)
-        if child:
-            if self.column_num:
-                for i, c in enumerate(child):
-                    self.attach(c, i % self.column_num, i // self.column_num, 1, 1)
-            elif self.row_num:
-                for i, c in enumerate(child):
-                    self.attach(c, i // self.row_num, i % self.row_num, 1, 1)
-            else:
-                for c in child:
-                    if c:   
-                        self.add(c)
+        removed = len(self.get_children())
+        if self._keyed:
+            widgets = self._keyed.reconcile(
+                child,
+                insert=lambda widget, position: self.attach(
+                    widget, *self.__get_position(position), 1, 1
+                ),
+                remove=self.remove,
+                move=lambda widget, position: None,
+            )
+            self.__relayout(widgets, 0)
+        else:
+            for c in self.get_children():
+                self.remove(c)
+            if child:
+                if self.column_num:
+                    for i, c in enumerate(child):
+                        self.attach(c, i % self.column_num, i // self.column_num, 1, 1)
+                elif self.row_num:
+                    for i, c in enumerate(child):
+                        self.attach(c, i // self.row_num, i % self.row_num, 1, 1)
+                else:
+                    for c in child:
+                        if c:   
+                            self.add(c)
+        self.emit("children_changed", 0, removed, len(self.get_children()))
+
+    def _ordered_children(self) -> List[Gtk.Widget]:
+        return sorted(self.get_children(), key=self.__get_index)
+
+    def _insert_child(self, widget: Gtk.Widget, position: int) -> None:
+        children = self._ordered_children()
+        children.insert(position, widget)
+        self.__relayout(children, position + 1)
+        self.attach(widget, *self.__get_position(position), 1, 1)
+
+    def _remove_child(self, widget: Gtk.Widget, position: int) -> None:
+        children = self._ordered_children()
+        children.remove(widget)
+        self.remove(widget)
+        self.__relayout(children, position)
+
+    def _move_child(self, widget: Gtk.Widget, position: int) -> None:
+        children = self._ordered_children()
+        old_position = children.index(widget)
+        children.remove(widget)
+        children.insert(position, widget)
+        self.__relayout(children, min(position, old_position))
+
+    def __relayout(self, children: List[Gtk.Widget], start: int) -> None:
+        # cells after ``start`` shift by one, only re-attach those whose coordinates changed
+        for i in range(start, len(children)):
+            widget = children[i]
+            left, top = self.__get_position(i)
+            if (
+                self.child_get_property(widget, "left-attach") != left
+                or self.child_get_property(widget, "top-attach") != top
+            ):
+                self.child_set_property(widget, "left-attach", left)
+                self.child_set_property(widget, "top-attach", top)
+
+    def __get_index(self, widget: Gtk.Widget) -> int:
+        left = self.child_get_property(widget, "left-attach")
+        top = self.child_get_property(widget, "top-attach")
+        if self.column_num:
+            return top * self.column_num + left
+        elif self.row_num:
+            return left * self.row_num + top
+        else:
+            return left
+
+    def __get_position(self, index: int) -> tuple:
+        if self.column_num:
+            return index % self.column_num, index // self.column_num
+        elif self.row_num:
+            return index // self.row_num, index % self.row_num
+        else:
+            return index, 0
@@ -1,6 +1,8 @@
 import os
 from lst.base_widget import BaseWidget
-from gi.repository import Gtk, GdkPixbuf, GObject
+from lst.icon_cache import icon_cache
+from lst.pixbuf_cache import pixbuf_cache
+from gi.repository import Gtk, Gdk, GdkPixbuf, GObject
 from typing import Union, Any
 
 
@@ -10,11 +12,20 @@ class Image(Gtk.Image, BaseWidget):
 
     An image widget. You can pass icon name, path to image or GdkPixbuf.
 
+    Image files are decoded directly at the requested size and shared between all images
+    through :class:`~lst.pixbuf_cache.PixbufCache`, so setting the same file again does not decode it again.
+    On HiDPI monitors images are decoded at ``width * scale`` x ``height * scale`` pixels and drawn at the monitor's
+    scale factor, and are updated when the widget moves to a monitor with another scale.
+    Icons found in the icon theme are rendered once per name, size and scale and shared through
+    :class:`~lst.icon_cache.IconCache`; use ``icon_cache.prefetch`` to render long icon lists in idle time.
+
     Parameters:
         image(``Union[str, GdkPixbuf.Pixbuf]``, optional): Icon name, path to image or ``GdkPixbuf.Pixbuf``.
         pixel_size(``int``, optional): Size of icon. Work if image setted from icon name.
         width(``int``, optional): Width of image. Work if image setted from path or ``GdkPixbuf.Pixbuf``.
         height(``int``, optional): Height of image. Work if image setted from path or ``GdkPixbuf.Pixbuf``.
+        load_async(``bool``, optional): Decode image files on a worker thread instead of the main loop.
+        placeholder(``str``, optional): Icon name shown while an image file is being decoded with ``load_async``.
 
     .. hint::
         if it is unknown whether the image is the path, icon name or GdkPixbuf
@@ -43,6 +54,19 @@ class Image(Gtk.Image, BaseWidget):
             width=20,
             height=30
         )
+
+    Large images such as album art can be decoded without blocking the main loop.
+    If the image changes again before the previous file is decoded, the stale result is dropped:
+
+    .. code-block:: python
+
+        Widget.Image(
+            image=player.bind("art_url"),
+            width=64,
+            height=64,
+            load_async=True,
+            placeholder="audio-x-generic-symbolic",
+        )
     """
     __gproperties__ = {**BaseWidget.gproperties}
 
@@ -52,6 +76,8 @@ class Image(Gtk.Image, BaseWidget):
         pixel_size: int = 16,
         width: int = 16,
         height: int = 16,
+        load_async: bool = False,
+        placeholder: str = None,
         **kwargs,
     ):
         Gtk.Image.__init__(self)
@@ -61,6 +87,14 @@ class Image(Gtk.Image, BaseWidget):
         self._width = width
         self._height = height
         self._type = None
+        self._load_async = load_async
+        self._placeholder = placeholder
+        self._loading = None
+
+        self.connect("destroy", lambda *args: self.__cancel_load())
+        self.connect("destroy", lambda *args: icon_cache.untrack(self))
+        self.connect("notify::scale-factor", lambda *args: self.__update())
+        self.connect("notify::pixel-size", lambda *args: self._refresh_icon())
 
         self.image = image
         self.pixel_size = pixel_size
@@ -82,26 +116,113 @@ class Image(Gtk.Image, BaseWidget):
 
     @image.setter
     def image(self, value: Union[str, GdkPixbuf.Pixbuf]) -> None:
+        self.__cancel_load()
         self._type = self.__get_image_type(value)
+        self._image = value
+
+        if self._type is None:
+            self._type = "icon"
+        if self._type == "icon":
+            icon_cache.track(self)
+        else:
+            icon_cache.untrack(self)
+        self.__update()
+
+        self.pixel_size = self.pixel_size
+
+    def __update(self) -> None:
+        if self._type == "icon":
+            self.__update_icon()
+        else:
+            self.__update_pixbuf()
+
+    def _refresh_icon(self) -> None:
+        if self._type == "icon":
+            self.__update_icon()
+
+    def __update_icon(self) -> None:
+        name = self._image if isinstance(self._image, str) else "image-missing"
+        size = self.pixel_size
+        # symbolic icons are recolored by GTK to match the CSS color, so they can't be shared
+        if size > 0 and not name.endswith("-symbolic"):
+            scale = self.get_scale_factor()
+            pixbuf = icon_cache.load(name, size, scale)
+            if pixbuf is not None:
+                self.__set_pixbuf(pixbuf, scale)
+                return
+        self.set_from_icon_name(icon_name=name, size=Gtk.IconSize.from_name(name))
+
+    def __update_pixbuf(self) -> None:
+        width = self._width or -1
+        height = self._height or -1
+        # decode at device pixels on HiDPI monitors, images with an unscaled side keep their size
+        scale = self.get_scale_factor() if width != -1 and height != -1 else 1
 
         if self._type == "pixbuf":
-            self.set_from_pixbuf(pixbuf=value)
+            if width == -1 and height == -1:
+                self.set_from_pixbuf(pixbuf=self._image)
+            else:
+                self.__set_pixbuf(
+                    self._image.scale_simple(
+                        width * scale if width != -1 else self._image.get_width(),
+                        height * scale if height != -1 else self._image.get_height(),
+                        GdkPixbuf.InterpType.BILINEAR,
+                    ),
+                    scale,
+                )
 
         elif self._type == "file":
-            self.set_from_file(filename=value)
+            if not self._load_async:
+                self.__set_pixbuf(
+                    pixbuf_cache.load(self._image, width, height, scale), scale
+                )
+                return
 
-        elif self._type == "icon":
-            self.set_from_icon_name(icon_name=value, size=Gtk.IconSize.from_name(value))
+            self.__cancel_load()
+            pixbuf = pixbuf_cache.lookup(self._image, width, height, scale)
+            if pixbuf is not None:
+                self.__set_pixbuf(pixbuf, scale)
+                return
+
+            if self._placeholder:
+                self.set_from_icon_name(
+                    icon_name=self._placeholder,
+                    size=Gtk.IconSize.from_name(self._placeholder),
+                )
+            future = self._loading = pixbuf_cache.load_async(
+                self._image,
+                width,
+                height,
+                scale,
+                lambda pixbuf, error: self.__on_loaded(future, pixbuf, scale, error),
+            )
+
+    def __set_pixbuf(self, pixbuf: GdkPixbuf.Pixbuf, scale: int) -> None:
+        if scale == 1:
+            self.set_from_pixbuf(pixbuf=pixbuf)
         else:
+            self.set_from_surface(
+                Gdk.cairo_surface_create_from_pixbuf(pixbuf, scale, self.get_window())
+            )
+
+    def __on_loaded(
+        self, future, pixbuf: GdkPixbuf.Pixbuf, scale: int, error: Exception
+    ) -> None:
+        if future is not self._loading:
+            return
+        self._loading = None
+        if error:
+            print(f"Failed to load image {self._image}: {error}")
             self.set_from_icon_name(
                 icon_name="image-missing", size=Gtk.IconSize.from_name("image-missing")
             )
-            self._type = "icon"
+        else:
+            self.__set_pixbuf(pixbuf, scale)
 
-        self._image = value
-        self.pixel_size = self.pixel_size
-        self.height = self._height
-        self.width = self._width
+    def __cancel_load(self) -> None:
+        if self._loading:
+            self._loading.cancel()
+            self._loading = None
 
     @GObject.Property
     def height(self) -> int:
@@ -110,37 +231,31 @@ class Image(Gtk.Image, BaseWidget):
     @height.setter
     def height(self, value: int) -> None:
         if value:
-            if self._type == "pixbuf":
-                scalled_image = self._image.scale_simple(
-                    self.width, value, GdkPixbuf.InterpType.BILINEAR
-                )
-                self.set_from_pixbuf(pixbuf=scalled_image)
-
-            elif self._type == "file":
-                scalled_image = GdkPixbuf.Pixbuf.new_from_file(
-                    self._image
-                ).scale_simple(self.width, value, GdkPixbuf.InterpType.BILINEAR)
-                self.set_from_pixbuf(pixbuf=scalled_image)
-
             self._height = value
+            self.__update_pixbuf()
 
     @GObject.Property
     def width(self) -> int:
-        return self._height
+        return self._width
 
     @width.setter
     def width(self, value: int) -> None:
         if value:
-            if self._type == "pixbuf":
-                scalled_image = self._image.scale_simple(
-                    value, self.height, GdkPixbuf.InterpType.BILINEAR
-                )
-                self.set_from_pixbuf(pixbuf=scalled_image)
+            self._width = value
+            self.__update_pixbuf()
 
-            elif self._type == "file":
-                scalled_image = GdkPixbuf.Pixbuf.new_from_file(
-                    self._image
-                ).scale_simple(value, self.height, GdkPixbuf.InterpType.BILINEAR)
-                self.set_from_pixbuf(pixbuf=scalled_image)
+    @GObject.Property
+    def load_async(self) -> bool:
+        return self._load_async
 
-            self._width = value
+    @load_async.setter
+    def load_async(self, value: bool) -> None:
+        self._load_async = value
+
+    @GObject.Property
+    def placeholder(self) -> str:
+        return self._placeholder
+
+    @placeholder.setter
+    def placeholder(self, value: str) -> None:
+        self._placeholder = value
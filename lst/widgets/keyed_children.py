@@ -0,0 +1,69 @@
+from gi.repository import Gtk
+from lst.binding import same_value
+from typing import Any, List
+
+
+class KeyedChildren:
+    """
+    Keeps the children of a container in sync with a list of items.
+
+    Every item is identified by ``key(item)`` (the item itself by default). Widgets are
+    created with ``factory(item)`` only for new keys, destroyed for keys that disappeared
+    and moved when the order changed; rows whose key is still present are reused.
+    If ``update`` is given it is called as ``update(widget, item)`` when the item for
+    an existing key is no longer equal to the previous one.
+    """
+
+    def __init__(self, factory: callable, key: callable = None, update: callable = None):
+        self._factory = factory
+        self._key = key
+        self._update = update
+        self._entries = {}
+        self._order = []
+
+    def reconcile(
+        self,
+        items: List[Any],
+        insert: callable,
+        remove: callable,
+        move: callable,
+    ) -> List[Gtk.Widget]:
+        new = []
+        seen = set()
+        for item in items or []:
+            if item is None:
+                continue
+            key = self._key(item) if self._key else item
+            if key in seen:
+                print(f"Duplicate child key: {key}")
+                continue
+            seen.add(key)
+            new.append((key, item))
+
+        for key in self._order:
+            if key not in seen:
+                widget = self._entries.pop(key)[0]
+                remove(widget)
+                widget.destroy()
+        self._order = [key for key in self._order if key in seen]
+
+        for position, (key, item) in enumerate(new):
+            entry = self._entries.get(key, None)
+            if entry is None:
+                widget = self._factory(item)
+                self._entries[key] = (widget, item)
+                self._order.insert(position, key)
+                insert(widget, position)
+                continue
+
+            widget, old_item = entry
+            if self._update and not same_value(old_item, item):
+                self._update(widget, item)
+            self._entries[key] = (widget, item)
+
+            if self._order[position] != key:
+                self._order.remove(key)
+                self._order.insert(position, key)
+                move(widget, position)
+
+        return [self._entries[key][0] for key in self._order]
@@ -1,16 +1,24 @@
 from gi.repository import Gtk, GObject
 from lst.base_widget import BaseWidget
+from lst.widgets.keyed_children import KeyedChildren
+from lst.widgets.child_list import ChildList
 from typing import List
 
 
-class Menu(Gtk.Menu, BaseWidget):
+class Menu(ChildList, Gtk.Menu, BaseWidget):
     """
     Subclass of `Gtk.Menu <https://lazka.github.io/pgi-docs/#Gtk-3.0/classes/Menu.html>`_
     
     A drop down menu consisting of a list of :class:`~lst.widgets.Widget.MenuItem`.
 
     Parameters:
-        child(``List[Gtk.MenuItem]``, optional): A list of :class:`~lst.widgets.Widget.MenuItem`.
+        child(``List[Gtk.MenuItem]``, optional): A list of :class:`~lst.widgets.Widget.MenuItem`. If ``child_factory`` is passed, the list of items to build entries from.
+        child_factory (``callable``, optional): Enables keyed mode, see :class:`~lst.widgets.Widget.Box`.
+        child_key (``callable``, optional): Function that returns a unique key for an item.
+        child_update (``callable``, optional): Function ``(widget, item)`` called when the item of an existing entry changes.
+
+    ``append``, ``prepend`` and ``insert`` keep the ``Gtk.MenuShell`` signatures and also emit ``children_changed``,
+    see :class:`~lst.widgets.child_list.ChildList`.
 
     .. code-block:: python
 
@@ -22,13 +30,22 @@ class Menu(Gtk.Menu, BaseWidget):
         )
     """
     __gproperties__ = {**BaseWidget.gproperties}
+    __gsignals__ = {**ChildList.gsignals}
 
     def __init__(
         self,
         child: List[Gtk.MenuItem] = None,
+        child_factory: callable = None,
+        child_key: callable = None,
+        child_update: callable = None,
         **kwargs
     ):
         Gtk.Menu.__init__(self)
+        self._keyed = (
+            KeyedChildren(child_factory, child_key, child_update)
+            if child_factory
+            else None
+        )
         BaseWidget.__init__(self, **kwargs)
 
         self.child = child
@@ -39,9 +56,28 @@ class Menu(Gtk.Menu, BaseWidget):
 
     @child.setter
     def child(self, child: List[Gtk.MenuItem]) -> None:
-        for c in self.get_children():
-            self.remove(c)
-        if child:
-            for c in child:
-                if c:
-                    self.add(c)
+        removed = len(self.get_children())
+        if self._keyed:
+            self._keyed.reconcile(
+                child,
+                insert=self._insert_child,
+                remove=self.remove,
+                move=self.reorder_child,
+            )
+        else:
+            for c in self.get_children():
+                self.remove(c)
+            if child:
+                for c in child:
+                    if c:
+                        self.add(c)
+        self.emit("children_changed", 0, removed, len(self.get_children()))
+
+    def _insert_child(self, widget: Gtk.MenuItem, position: int) -> None:
+        Gtk.Menu.insert(self, widget, position)
+
+    def _remove_child(self, widget: Gtk.MenuItem, position: int) -> None:
+        self.remove(widget)
+
+    def _move_child(self, widget: Gtk.MenuItem, position: int) -> None:
+        self.reorder_child(widget, position)
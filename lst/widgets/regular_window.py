@@ -1,4 +1,3 @@
-from lst.app import app
 from gi.repository import Gtk, GObject
 from lst.base_widget import BaseWidget
 
@@ -46,6 +45,9 @@ class RegularWindow(Gtk.Window, BaseWidget):
         self.show_header_bar = show_header_bar
         self.show_close_button = show_close_button
 
+        # imported here so that importing the widgets does not start the app and claim its D-Bus name
+        from lst.app import app
+
         app.add_window(namespace, self)
 
     @GObject.Property
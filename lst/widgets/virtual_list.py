@@ -0,0 +1,172 @@
+import bisect
+from gi.repository import Gtk, GObject, GLib
+from lst.base_widget import BaseWidget
+from typing import Any, List
+
+
+class VirtualList(Gtk.ScrolledWindow, BaseWidget):
+    """
+    Bases: `Gtk.ScrolledWindow <https://lazka.github.io/pgi-docs/#Gtk-3.0/classes/ScrolledWindow.html>`_, :class:`~lst.base_widget.BaseWidget`.
+
+    A scrollable vertical list that builds widgets only for the rows in the visible area (plus ``overscan`` pixels above and below).
+    Rows may have different heights: every row is measured when it is shown, and rows not measured yet count as ``row_height``.
+
+    If ``row_update`` is passed, rows that scroll out of view are reused for other items instead of being destroyed.
+
+    Parameters:
+        items(``list``, optional): The list of items, e.g. ``applications.bind("apps")``.
+        row_factory(``callable``): Function that builds a row widget from an item.
+        row_update(``callable``, optional): Function ``(widget, item)`` that makes an existing row show another item.
+        row_height(``int``, optional): Estimated height of a row that was not measured yet.
+        overscan(``int``, optional): How many pixels outside the visible area are filled with rows.
+
+    .. code-block:: python
+
+        Widget.VirtualList(
+            items=applications.bind("apps"),
+            row_factory=lambda app: Widget.Label(label=app.name, halign="start"),
+            row_update=lambda row, app: row.set_label(app.name),
+            row_height=32,
+            vexpand=True,
+        )
+    """
+
+    __gproperties__ = {**BaseWidget.gproperties}
+
+    def __init__(
+        self,
+        items: List[Any] = None,
+        row_factory: callable = None,
+        row_update: callable = None,
+        row_height: int = 32,
+        overscan: int = 200,
+        **kwargs,
+    ):
+        Gtk.ScrolledWindow.__init__(self)
+        self._layout = Gtk.Layout()
+        self._row_factory = row_factory
+        self._row_update = row_update
+        self._row_height = row_height
+        self._overscan = overscan
+
+        self._items = []
+        self._heights = []
+        self._offsets = [0]
+        self._offsets_dirty = False
+        self._rows = {}
+        self._pool = []
+        self._width = 1
+        self._update_id = None
+
+        BaseWidget.__init__(self, **kwargs)
+
+        self.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+        self.add(self._layout)
+        vadjustment = self.get_vadjustment()
+        vadjustment.connect("value-changed", lambda *args: self.__queue_update())
+        vadjustment.connect("changed", lambda *args: self.__queue_update())
+        self._layout.connect(
+            "size-allocate", lambda widget, allocation: self.__on_size_allocate(allocation)
+        )
+
+        self.items = items
+
+    @GObject.Property
+    def items(self) -> List[Any]:
+        return self._items
+
+    @items.setter
+    def items(self, value: List[Any]) -> None:
+        for index in list(self._rows):
+            self.__release_row(index)
+        self._items = list(value) if value else []
+        self._heights = [None] * len(self._items)
+        self._offsets_dirty = True
+        self.__queue_update()
+
+    @GObject.Property
+    def realized_rows(self) -> int:
+        return len(self._rows)
+
+    def __queue_update(self) -> None:
+        if not self._update_id:
+            # runs before the redraw, so freshly scrolled-in rows are never painted blank
+            self._update_id = GLib.idle_add(
+                self.__update_viewport, priority=GLib.PRIORITY_HIGH_IDLE
+            )
+
+    def __on_size_allocate(self, allocation) -> None:
+        if allocation.width == self._width:
+            return
+        self._width = allocation.width
+        for index in list(self._rows):
+            self.__release_row(index)
+        self._heights = [None] * len(self._items)
+        self._offsets_dirty = True
+        self.__queue_update()
+
+    def __get_offsets(self) -> List[int]:
+        if self._offsets_dirty:
+            offsets = [0]
+            for height in self._heights:
+                offsets.append(offsets[-1] + (self._row_height if height is None else height))
+            self._offsets = offsets
+            self._offsets_dirty = False
+        return self._offsets
+
+    def __acquire_row(self, index: int) -> Gtk.Widget:
+        item = self._items[index]
+        if self._pool:
+            widget = self._pool.pop()
+            self._row_update(widget, item)
+            widget.set_size_request(self._width, -1)
+            widget.show()
+        else:
+            widget = self._row_factory(item)
+            widget.set_size_request(self._width, -1)
+            self._layout.put(widget, 0, 0)
+            widget.show_all()
+        return widget
+
+    def __release_row(self, index: int) -> None:
+        widget = self._rows.pop(index)
+        if self._row_update:
+            widget.hide()
+            self._pool.append(widget)
+        else:
+            self._layout.remove(widget)
+            widget.destroy()
+
+    def __update_viewport(self) -> bool:
+        self._update_id = None
+
+        vadjustment = self.get_vadjustment()
+        top = vadjustment.get_value() - self._overscan
+        bottom = vadjustment.get_value() + vadjustment.get_page_size() + self._overscan
+
+        offsets = self.__get_offsets()
+        first = max(bisect.bisect_right(offsets, top) - 1, 0)
+        last = min(bisect.bisect_left(offsets, bottom), len(self._items))
+
+        for index in [i for i in self._rows if i < first or i >= last]:
+            self.__release_row(index)
+
+        measured = False
+        for index in range(first, last):
+            if index not in self._rows:
+                widget = self._rows[index] = self.__acquire_row(index)
+                height = widget.get_preferred_height_for_width(self._width)[1]
+                if height != self._heights[index]:
+                    self._heights[index] = height
+                    self._offsets_dirty = True
+                    measured = True
+
+        offsets = self.__get_offsets()
+        for index, widget in self._rows.items():
+            self._layout.move(widget, 0, offsets[index])
+        self._layout.set_size(self._width, offsets[-1])
+
+        if measured:
+            # real heights may differ from the estimate, so the visible range may have changed
+            self.__queue_update()
+        return False
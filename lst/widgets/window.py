@@ -1,5 +1,5 @@
-from lst.app import app
-from gi.repository import Gtk, GtkLayerShell, GObject, Gdk
+from lst.profiler import profiler
+from gi.repository import Gtk, GtkLayerShell, GObject, Gdk, GLib
 from lst.base_widget import BaseWidget
 from typing import List
 
@@ -91,14 +91,25 @@ class Window(Gtk.Window, BaseWidget):
         self.monitor = monitor
         self.popup = popup
 
+        # imported here so that importing the widgets does not start the app and claim its D-Bus name
+        from lst.app import app
+
         app.add_window(namespace, self)
+        if profiler.enabled:
+            self.connect("map-event", lambda *args: self.__first_map())
         self.connect("key-press-event", lambda x, event: self.__close_popup(event))
 
         BaseWidget.__init__(self, **kwargs)
 
+    def __first_map(self) -> None:
+        profiler.mark(f"window mapped: {self._namespace}", "window")
+        GLib.idle_add(profiler.finish)
+
     def __close_popup(self, event):
         if self._popup:
             if event.get_keyval()[1] == Gdk.KEY_Escape:
+                from lst.app import app
+
                 app.close_window(GtkLayerShell.get_namespace(self))
 
     @GObject.Property